@@ -5,11 +5,12 @@ SLA Path Model v1 - Main Entry Point
 Run transit time feasibility analysis for parcel network optimization.
 
 Usage:
-    python scripts/run.py [--input INPUT_FILE] [--output OUTPUT_FILE]
+    python scripts/run.py [--input INPUT_FILE] [--output OUTPUT_FILE] [--format {xlsx,parquet}]
 
 Output naming:
     - If --output is specified, uses that path
     - Otherwise, derives name from scenario_id(s) in input file
+    - Parquet output is a directory with one <report>.parquet file per report
 """
 import argparse
 import sys
@@ -19,43 +20,43 @@ from pathlib import Path
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from sla_path_model.config import DEFAULT_INPUT_FILE, DEFAULT_OUTPUT_FILE, SortLevel, parse_enabled_sort_levels
-from sla_path_model.io_loader import InputLoader
-from sla_path_model.validators import validate_inputs
-from sla_path_model.demand_builder import build_od_demand
-from sla_path_model.path_enumeration import enumerate_all_paths
-from sla_path_model.timing_engine import calculate_all_path_timings
-from sla_path_model.feasibility import check_all_feasibility
-from sla_path_model.reporting import build_all_reports
-from sla_path_model.write_outputs import write_outputs
-from sla_path_model.utils import setup_logging
+# config is stdlib-only; pipeline modules (pandas, numpy, openpyxl) are imported in main()
+# after argument parsing so --help and usage errors stay fast
+from sla_path_model.config import DEFAULT_INPUT_FILE, OUTPUT_FORMATS, parse_enabled_sort_levels
+
+
+# Characters not allowed in Windows filenames, mapped to underscores
+_FILENAME_INVALID_CHARS = str.maketrans('<>:"/\\|?*', '_' * 9)
 
 
 def build_scenario_sort_levels(scenarios_df) -> dict[str, frozenset]:
     """Build mapping from scenario_id to its enabled sort levels."""
+    if "enabled_sort_levels" in scenarios_df.columns:
+        raw_values = scenarios_df["enabled_sort_levels"].tolist()
+    else:
+        raw_values = [None] * len(scenarios_df)
+
     result = {}
-    for _, row in scenarios_df.iterrows():
-        scenario_id = str(row["scenario_id"])
-        raw = row.get("enabled_sort_levels") if "enabled_sort_levels" in scenarios_df.columns else None
+    for scenario_id, raw in zip(scenarios_df["scenario_id"].astype(str), raw_values):
         result[scenario_id] = parse_enabled_sort_levels(raw)
     return result
 
 
-def derive_output_filename(scenarios_df, output_dir: str = "outputs") -> str:
+def derive_output_filename(scenarios_df, output_dir: str = "outputs", output_format: str = "xlsx") -> str:
     scenario_ids = scenarios_df["scenario_id"].astype(str).unique().tolist()
 
     if len(scenario_ids) == 1:
-        filename = f"{scenario_ids[0]}.xlsx"
+        combined = scenario_ids[0]
     else:
         if len(scenario_ids) <= 3:
             combined = "_".join(scenario_ids)
         else:
             combined = f"{scenario_ids[0]}_{scenario_ids[1]}_and_{len(scenario_ids)-2}_more"
-        filename = f"{combined}.xlsx"
 
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Parquet output is a directory of per-report files, so no extension
+    filename = f"{combined}.xlsx" if output_format == "xlsx" else combined
+
+    filename = filename.translate(_FILENAME_INVALID_CHARS)
 
     return str(Path(output_dir) / filename)
 
@@ -79,6 +80,24 @@ def main():
         default="outputs",
         help="Output directory when deriving filename from scenario_id (default: outputs)"
     )
+    parser.add_argument(
+        "--format", "-f",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default="xlsx",
+        help="Output format: xlsx workbook or directory of Parquet files (default: xlsx)"
+    )
+    parser.add_argument(
+        "--input-cache",
+        default=None,
+        help="Directory for caching parsed inputs between runs, e.g. .cache/sla_inputs (default: off)"
+    )
+    parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=1,
+        help="Worker processes for path enumeration and timing (default: 1, no pool)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -88,6 +107,16 @@ def main():
     args = parser.parse_args()
 
     import logging
+    from sla_path_model.io_loader import InputLoader, load_all_cached
+    from sla_path_model.validators import validate_inputs
+    from sla_path_model.demand_builder import build_od_demand
+    from sla_path_model.path_enumeration import enumerate_all_paths
+    from sla_path_model.timing_engine import calculate_all_path_timings
+    from sla_path_model.feasibility import check_all_feasibility
+    from sla_path_model.reporting import build_all_reports
+    from sla_path_model.write_outputs import write_outputs, check_parquet_support
+    from sla_path_model.utils import setup_logging
+
     log_level = logging.DEBUG if args.verbose else logging.INFO
     logger = setup_logging(log_level)
 
@@ -97,14 +126,20 @@ def main():
     logger.info("=" * 60)
 
     try:
+        if args.output_format == "parquet":
+            check_parquet_support()
+
         logger.info("Step 1: Loading inputs...")
-        loader = InputLoader(args.input)
-        data = loader.load_all()
+        if args.input_cache:
+            data = load_all_cached(args.input, args.input_cache)
+        else:
+            loader = InputLoader(args.input)
+            data = loader.load_all()
 
         if args.output:
             output_path = args.output
         else:
-            output_path = derive_output_filename(data["scenarios"], args.output_dir)
+            output_path = derive_output_filename(data["scenarios"], args.output_dir, args.output_format)
 
         logger.info(f"Output will be written to: {output_path}")
 
@@ -120,10 +155,15 @@ def main():
         logger.info(f"Enabled sort levels (global union): {sorted(sl.value for sl in global_enabled_levels)}")
 
         logger.info("Step 4: Enumerating paths...")
-        od_paths = enumerate_all_paths(data, od_demands, enabled_sort_levels=global_enabled_levels)
+        od_paths = enumerate_all_paths(
+            data,
+            od_demands,
+            enabled_sort_levels=global_enabled_levels,
+            workers=args.workers
+        )
 
         logger.info("Step 5: Calculating path timings...")
-        od_timings = calculate_all_path_timings(data, od_paths)
+        od_timings = calculate_all_path_timings(data, od_paths, workers=args.workers)
 
         logger.info("Step 6: Checking SLA feasibility...")
         od_timings = check_all_feasibility(
@@ -142,7 +182,7 @@ def main():
         )
 
         logger.info("Step 8: Writing outputs...")
-        write_outputs(reports, output_path)
+        write_outputs(reports, output_path, args.output_format)
 
         elapsed = time.time() - start_time
         logger.info("=" * 60)
@@ -152,11 +192,14 @@ def main():
 
         if "summary" in reports:
             summary = reports["summary"]
-            for _, row in summary.iterrows():
-                logger.info(f"  Scenario {row['scenario_id']}:")
-                logger.info(f"    Total packages: {row['total_packages']:,.0f}")
-                logger.info(f"    Volume at SLA: {row['pct_volume_at_sla']*100:.1f}%")
-                logger.info(f"    Avg TNT: {row['avg_tnt_hours']:.1f} hours")
+            for scenario_id, total_packages, pct_volume_at_sla, avg_tnt_hours in zip(
+                    summary["scenario_id"], summary["total_packages"],
+                    summary["pct_volume_at_sla"], summary["avg_tnt_hours"]
+            ):
+                logger.info(f"  Scenario {scenario_id}:")
+                logger.info(f"    Total packages: {total_packages:,.0f}")
+                logger.info(f"    Volume at SLA: {pct_volume_at_sla*100:.1f}%")
+                logger.info(f"    Avg TNT: {avg_tnt_hours:.1f} hours")
 
         return 0
 
@@ -166,6 +209,9 @@ def main():
     except ValueError as e:
         logger.error(f"Validation error: {e}")
         return 1
+    except ImportError as e:
+        logger.error(str(e))
+        return 1
     except Exception as e:
         logger.exception(f"Unexpected error: {e}")
         return 1
@@ -1,5 +1,5 @@
 """Configuration: constants, enums, and dataclasses for SLA Path Model."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, time
 from enum import Enum
 from typing import Optional
@@ -11,8 +11,13 @@ MINUTES_PER_HOUR = 60
 HOURS_PER_DAY = 24
 MINUTES_PER_DAY = 1440
 
+# Day names in date.weekday() order; CPT days_of_week is a bitmask over this (Mon = bit 0)
+DAYS_OF_WEEK = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+ALL_DAYS_MASK = 0x7F
+
 DEFAULT_INPUT_FILE = "data/input_sla_model_v1.xlsx"
 DEFAULT_OUTPUT_FILE = "outputs/output_sla_model_v1.xlsx"
+OUTPUT_FORMATS = ("xlsx", "parquet")
 
 
 class FacilityType(str, Enum):
@@ -126,36 +131,41 @@ class SortWindow:
     end_local: time
     timezone: ZoneInfo
 
+    # Minutes after local midnight, precomputed once for the per-step window math
+    start_min: int = field(init=False, repr=False, compare=False)
+    end_min: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.start_min = self.start_local.hour * 60 + self.start_local.minute
+        self.end_min = self.end_local.hour * 60 + self.end_local.minute
+
     def crosses_midnight(self) -> bool:
         return self.end_local < self.start_local
 
     def duration_minutes(self) -> float:
-        start_mins = self.start_local.hour * 60 + self.start_local.minute
-        end_mins = self.end_local.hour * 60 + self.end_local.minute
-
-        if self.crosses_midnight():
-            return (MINUTES_PER_DAY - start_mins) + end_mins
-        else:
-            return end_mins - start_mins
+        return (self.end_min - self.start_min) + (MINUTES_PER_DAY if self.crosses_midnight() else 0)
 
 
-@dataclass
+@dataclass(slots=True)
 class CPT:
     origin: str
     dest: str
     cpt_sequence: int
     cpt_local: time
-    days_of_week: list[str]
+    days_of_week: int  # Bitmask over DAYS_OF_WEEK
     timezone: ZoneInfo
     is_active: bool
 
+    def runs_on(self, local_date) -> bool:
+        return (self.days_of_week >> local_date.weekday()) & 1 == 1
+
     def cpt_utc_for_date(self, local_date: datetime) -> datetime:
-        local_dt = datetime.combine(local_date.date(), self.cpt_local)
-        local_dt = local_dt.replace(tzinfo=self.timezone)
-        return local_dt.astimezone(ZoneInfo("UTC")).replace(tzinfo=None)
+        # Deferred import: time_utils imports this module
+        from .time_utils import local_time_to_utc
+        return local_time_to_utc(local_date.date(), self.cpt_local, self.timezone)
 
 
-@dataclass
+@dataclass(slots=True)
 class ServiceCommitment:
     origin: str
     dest: str
@@ -171,7 +181,7 @@ class ServiceCommitment:
         return origin_match and dest_match and zone_match
 
 
-@dataclass
+@dataclass(slots=True)
 class MileageBand:
     zone: int
     mileage_band_min: float
@@ -180,7 +190,7 @@ class MileageBand:
     mph: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Facility:
     name: str
     facility_type: FacilityType
@@ -203,35 +213,38 @@ class Facility:
     max_inbound_trucks_per_hour: Optional[float]
     max_outbound_trucks_per_hour: Optional[float]
 
-    def get_mm_sort_window(self) -> Optional[SortWindow]:
-        if self.mm_sort_start_local and self.mm_sort_end_local:
+    # Windows are built once from the local times above (see __post_init__)
+    _mm_sort_window: Optional[SortWindow] = field(init=False, repr=False, compare=False)
+    _lm_sort_window: Optional[SortWindow] = field(init=False, repr=False, compare=False)
+    _outbound_window: Optional[SortWindow] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._mm_sort_window = self._build_window(self.mm_sort_start_local, self.mm_sort_end_local)
+        self._lm_sort_window = self._build_window(self.lm_sort_start_local, self.lm_sort_end_local)
+        self._outbound_window = self._build_window(
+            self.outbound_window_start_local, self.outbound_window_end_local
+        )
+
+    def _build_window(self, start_local: Optional[time], end_local: Optional[time]) -> Optional[SortWindow]:
+        if start_local and end_local:
             return SortWindow(
-                start_local=self.mm_sort_start_local,
-                end_local=self.mm_sort_end_local,
+                start_local=start_local,
+                end_local=end_local,
                 timezone=self.timezone
             )
         return None
 
+    def get_mm_sort_window(self) -> Optional[SortWindow]:
+        return self._mm_sort_window
+
     def get_lm_sort_window(self) -> Optional[SortWindow]:
-        if self.lm_sort_start_local and self.lm_sort_end_local:
-            return SortWindow(
-                start_local=self.lm_sort_start_local,
-                end_local=self.lm_sort_end_local,
-                timezone=self.timezone
-            )
-        return None
+        return self._lm_sort_window
 
     def get_outbound_window(self) -> Optional[SortWindow]:
-        if self.outbound_window_start_local and self.outbound_window_end_local:
-            return SortWindow(
-                start_local=self.outbound_window_start_local,
-                end_local=self.outbound_window_end_local,
-                timezone=self.timezone
-            )
-        return None
+        return self._outbound_window
 
 
-@dataclass
+@dataclass(slots=True)
 class PathCandidate:
     origin: str
     dest: str
@@ -244,7 +257,7 @@ class PathCandidate:
     atw_factor: float
 
 
-@dataclass
+@dataclass(slots=True)
 class PathTimingResult:
     path: PathCandidate
     tnt_hours: float
@@ -263,7 +276,7 @@ class PathTimingResult:
     uses_only_active_arcs: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class PathStep:
     step_sequence: int
     step_type: StepType
@@ -292,7 +305,7 @@ class RunSettings:
     top_paths_per_sort_level: int  # Top N paths to keep per OD × sort_level
 
 
-@dataclass
+@dataclass(slots=True)
 class ODDemand:
     scenario_id: str
     origin: str
@@ -315,20 +328,19 @@ def minutes_to_time(minutes: float) -> time:
     return time(hour=hours, minute=mins, second=secs)
 
 
-def parse_days_of_week(days_str: Optional[str]) -> list[str]:
-    valid_days = {"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"}
-
+def parse_days_of_week(days_str: Optional[str]) -> int:
+    """Parse comma-separated day names into a DAYS_OF_WEEK bitmask (blank = every day)."""
     if not days_str or not days_str.strip():
-        return []
+        return ALL_DAYS_MASK
 
-    result = []
+    mask = 0
     for part in days_str.split(","):
         day = part.strip()
-        if day not in valid_days:
-            raise ValueError(f"Invalid day of week: '{day}'. Expected one of {sorted(valid_days)}")
-        result.append(day)
+        if day not in DAYS_OF_WEEK:
+            raise ValueError(f"Invalid day of week: '{day}'. Expected one of {sorted(DAYS_OF_WEEK)}")
+        mask |= 1 << DAYS_OF_WEEK.index(day)
 
-    return result
+    return mask
 
 
 def get_day_name(dt: datetime) -> str:
@@ -13,8 +13,8 @@ Generation logic:
 from datetime import datetime, timedelta
 from typing import Optional
 
-from .config import Facility, FacilityType, CPT, MINUTES_PER_DAY
-from .time_utils import time_to_minutes, minutes_to_time, local_to_utc, utc_to_local
+from .config import Facility, FacilityType, CPT, MINUTES_PER_DAY, ALL_DAYS_MASK
+from .time_utils import minutes_to_time, local_time_to_utc, utc_to_local
 from .utils import setup_logging
 
 logger = setup_logging()
@@ -26,25 +26,35 @@ class CPTGenerator:
         self.facilities = facilities
         self.arc_cpts = arc_cpts
 
-        self._explicit_cpts: dict[tuple[str, str], list[CPT]] = {}
+        explicit_cpts: dict[tuple[str, str], list[CPT]] = {}
         for cpt in arc_cpts:
             key = (cpt.origin, cpt.dest)
-            if key not in self._explicit_cpts:
-                self._explicit_cpts[key] = []
-            self._explicit_cpts[key].append(cpt)
-
-        for key in self._explicit_cpts:
-            self._explicit_cpts[key].sort(key=lambda c: c.cpt_sequence)
-
+            if key not in explicit_cpts:
+                explicit_cpts[key] = []
+            explicit_cpts[key].append(cpt)
+
+        # Arc CPT sequences are shared with callers, so they are stored as tuples
+        self._explicit_cpts: dict[tuple[str, str], tuple[CPT, ...]] = {
+            key: tuple(sorted(cpts, key=lambda c: c.cpt_sequence))
+            for key, cpts in explicit_cpts.items()
+        }
+
+        # Facility schedules are generated on first use (see _get_generated_cpts)
+        self._schedule_facilities = self._find_schedule_facilities()
         self._generated_cpts: dict[tuple[str, str], list[CPT]] = {}
-        self._generate_default_cpts()
+
+        # Resolved CPTs per arc, filled lazily by get_cpts_for_arc.
+        # CPTs are not modified after generation, so callers share the tuples.
+        self._arc_cpts: dict[tuple[str, str], tuple[CPT, ...]] = {}
 
         logger.info(
             f"CPT Generator initialized: {len(self._explicit_cpts)} explicit arcs, "
-            f"{len(self._generated_cpts)} generated facility schedules"
+            f"{len(self._schedule_facilities)} facilities with generated schedules"
         )
 
-    def _generate_default_cpts(self):
+    def _find_schedule_facilities(self) -> dict[str, Facility]:
+        """Hubs/hybrids with an outbound window and CPT count, i.e. those that get a generated schedule."""
+        schedule_facilities = {}
         for name, fac in self.facilities.items():
             if fac.facility_type not in (FacilityType.HUB, FacilityType.HYBRID):
                 continue
@@ -55,12 +65,27 @@ class CPTGenerator:
                     fac.outbound_cpt_count < 1):
                 continue
 
+            schedule_facilities[name] = fac
+        return schedule_facilities
+
+    def _get_generated_cpts(self, origin: str) -> Optional[list[CPT]]:
+        """Generated schedule for an origin, built on first request; None if it has none."""
+        fac = self._schedule_facilities.get(origin)
+        if fac is None:
+            return None
+
+        key = (origin, "*")
+        cpts = self._generated_cpts.get(key)
+        if cpts is None:
             cpts = self._generate_facility_cpts(fac)
-            self._generated_cpts[(name, "*")] = cpts
+            self._generated_cpts[key] = cpts
+        return cpts
 
     def _generate_facility_cpts(self, facility: Facility) -> list[CPT]:
-        start_mins = time_to_minutes(facility.outbound_window_start_local)
-        end_mins = time_to_minutes(facility.outbound_window_end_local)
+        # Outbound window minutes are precomputed on the facility's SortWindow
+        outbound_window = facility.get_outbound_window()
+        start_mins = outbound_window.start_min
+        end_mins = outbound_window.end_min
 
         if end_mins <= start_mins:
             window_duration = (MINUTES_PER_DAY - start_mins) + end_mins
@@ -87,7 +112,7 @@ class CPTGenerator:
                 dest="*",
                 cpt_sequence=seq,
                 cpt_local=minutes_to_time(int(cpt_mins)),
-                days_of_week=[],
+                days_of_week=ALL_DAYS_MASK,
                 timezone=facility.timezone,
                 is_active=True  # Generated CPTs default to active
             )
@@ -95,13 +120,21 @@ class CPTGenerator:
 
         return cpts
 
-    def get_cpts_for_arc(self, origin: str, dest: str) -> list[CPT]:
+    def get_cpts_for_arc(self, origin: str, dest: str) -> tuple[CPT, ...]:
+        key = (origin, dest)
+        cpts = self._arc_cpts.get(key)
+        if cpts is None:
+            cpts = self._resolve_arc_cpts(origin, dest)
+            self._arc_cpts[key] = cpts
+        return cpts
+
+    def _resolve_arc_cpts(self, origin: str, dest: str) -> tuple[CPT, ...]:
         if (origin, dest) in self._explicit_cpts:
             return self._explicit_cpts[(origin, dest)]
 
-        if (origin, "*") in self._generated_cpts:
-            facility_cpts = self._generated_cpts[(origin, "*")]
-            return [
+        facility_cpts = self._get_generated_cpts(origin)
+        if facility_cpts is not None:
+            return tuple(
                 CPT(
                     origin=cpt.origin,
                     dest=dest,
@@ -112,10 +145,10 @@ class CPTGenerator:
                     is_active=cpt.is_active
                 )
                 for cpt in facility_cpts
-            ]
+            )
 
         logger.debug(f"No CPTs defined for arc {origin}->{dest}")
-        return []
+        return ()
 
     def get_latest_cpt_before(
             self,
@@ -135,25 +168,26 @@ class CPTGenerator:
         before_local = utc_to_local(before_utc, origin_fac.timezone)
         before_date = before_local.date()
 
-        candidates = []
-        for day_offset in range(7):
-            check_date = before_date - timedelta(days=day_offset)
-
-            for cpt in cpts:
-                if cpt.days_of_week:
-                    day_name = check_date.strftime("%a")
-                    if day_name not in cpt.days_of_week:
-                        continue
-
-                cpt_local = datetime.combine(check_date, cpt.cpt_local)
-                cpt_utc = local_to_utc(cpt_local, cpt.timezone)
-
+        # Walk back day by day; a CPT's first departure at or before before_utc
+        # is its latest, so stop searching that CPT once it is found.
+        # Candidates are (cpt_utc, -day_offset, -cpt_index) so ties resolve to
+        # the same CPT the previous day-major scan picked.
+        best = None
+        for cpt_index, cpt in enumerate(cpts):
+            for day_offset in range(7):
+                check_date = before_date - timedelta(days=day_offset)
+                if not cpt.runs_on(check_date):
+                    continue
+
+                cpt_utc = local_time_to_utc(check_date, cpt.cpt_local, cpt.timezone)
                 if cpt_utc <= before_utc:
-                    candidates.append((cpt_utc, cpt))
+                    candidate = (cpt_utc, -day_offset, -cpt_index)
+                    if best is None or candidate > best:
+                        best = candidate
+                    break
 
-        if candidates:
-            candidates.sort(key=lambda x: x[0], reverse=True)
-            return candidates[0]
+        if best is not None:
+            return best[0], cpts[-best[2]]
 
         return None
 
@@ -161,7 +195,7 @@ class CPTGenerator:
 def get_cpts_for_path(
         path_nodes: list[str],
         cpt_generator: CPTGenerator
-) -> dict[tuple[str, str], list[CPT]]:
+) -> dict[tuple[str, str], tuple[CPT, ...]]:
     arc_cpts = {}
 
     for i in range(len(path_nodes) - 1):
@@ -18,13 +18,15 @@ Supports two demand sources (controlled by demand_source in scenarios sheet):
 Zip coverage is year-based via facility_YYYY columns in zips sheet (for population mode).
 Blank = zip not in coverage for that year.
 """
+import sys
 from collections import defaultdict
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 from .config import Facility, FacilityType, FlowType, MileageBand, ODDemand, DemandSource
-from .geo import haversine_miles, get_zone_for_distance
+from .geo import haversine_miles_matrix, get_zones_for_distances
 from .utils import setup_logging
 
 logger = setup_logging()
@@ -50,10 +52,27 @@ class DemandBuilder:
         self.mileage_bands = sorted(mileage_bands, key=lambda b: b.zone)
         self.market_demand_df = market_demand_df
 
+        self._build_facility_arrays()
         self._build_market_facility_mapping()
         self._parse_facility_year_columns()
         self._build_regional_hub_mapping()
         self._build_injection_shares()
+        self._build_demand_index()
+
+    def _build_facility_arrays(self):
+        """
+        Build column arrays of facility coordinates indexed by a contiguous facility index,
+        plus the facility x facility distance and zone matrices used by _calculate_zone.
+        """
+        self._fac_idx = {name: i for i, name in enumerate(self.facilities)}
+        self._lat = np.array([fac.lat for fac in self.facilities.values()], dtype=float)
+        self._lon = np.array([fac.lon for fac in self.facilities.values()], dtype=float)
+        self._is_hybrid = np.array(
+            [fac.facility_type == FacilityType.HYBRID for fac in self.facilities.values()], dtype=bool
+        )
+
+        self._dist = haversine_miles_matrix(self._lat, self._lon)
+        self._zone_lookup = get_zones_for_distances(self._dist, self.mileage_bands)
 
     def _build_market_facility_mapping(self):
         """
@@ -112,26 +131,37 @@ class DemandBuilder:
         self.available_years = sorted(self.facility_year_cols.keys())
         logger.info(f"Found facility columns for years: {self.available_years}")
 
-    def _build_destination_shares_for_year(self, year: int) -> dict[str, float]:
-        """Calculate destination share by population for a specific year."""
+    def _build_destination_shares_for_year(self, year: int) -> tuple[list[str], np.ndarray]:
+        """
+        Calculate destination share by population for a specific year.
+
+        Returns parallel (dest_names, dest_share) columns so the OD matrix can be
+        built with array ops; both are empty when no zips are assigned.
+        """
         if year not in self.facility_year_cols:
-            return {}
+            return [], np.empty(0)
 
         col = self.facility_year_cols[year]
 
         # Filter to zips with facility assignment (non-blank)
-        active_zips = self.zips_df[self.zips_df[col].notna() & (self.zips_df[col] != '')]
+        assigned = self.zips_df[col]
+        active = (assigned.notna() & (assigned != '')).to_numpy()
 
-        if active_zips.empty:
-            return {}
+        if not active.any():
+            return [], np.empty(0)
 
-        pop_by_fac = active_zips.groupby(col)['population'].sum()
+        # Sum population per facility: factorize once, then one bincount pass
+        # (sorted codes give the same facility order as groupby)
+        codes, facs = pd.factorize(assigned.to_numpy()[active], sort=True)
+        population = np.nan_to_num(self.zips_df['population'].to_numpy(dtype=float)[active])
+        pop_by_fac = np.bincount(codes, weights=population, minlength=len(facs))
         total_pop = pop_by_fac.sum()
 
         if total_pop > 0:
-            return (pop_by_fac / total_pop).to_dict()
+            dest_names = [sys.intern(fac) if isinstance(fac, str) else fac for fac in facs]
+            return dest_names, pop_by_fac / total_pop
 
-        return {}
+        return [], np.empty(0)
 
     def _build_regional_hub_mapping(self):
         """
@@ -155,6 +185,7 @@ class DemandBuilder:
         """Build injection facility shares for middle mile by year."""
         # Check if using new year-based format or legacy format
         share_cols = [c for c in self.injection_df.columns if c.startswith('share_')]
+        fac_names = [sys.intern(str(name).strip()) for name in self.injection_df["facility_name"].tolist()]
 
         if share_cols:
             # New year-based format
@@ -164,9 +195,8 @@ class DemandBuilder:
                 year = int(col.replace('share_', ''))
                 shares = {}
 
-                for _, row in self.injection_df.iterrows():
-                    fac_name = str(row["facility_name"]).strip()
-                    share = float(row[col])
+                for fac_name, share in zip(fac_names, self.injection_df[col].tolist()):
+                    share = float(share)
                     if share > 0:  # Only include facilities with non-zero share
                         shares[fac_name] = share
 
@@ -182,9 +212,8 @@ class DemandBuilder:
             self.injection_shares_by_year = {}
             shares = {}
 
-            for _, row in self.injection_df.iterrows():
-                fac_name = str(row["facility_name"]).strip()
-                share = float(row["absolute_share"])
+            for fac_name, share in zip(fac_names, self.injection_df["absolute_share"].tolist()):
+                share = float(share)
                 if share > 0:
                     shares[fac_name] = share
 
@@ -210,19 +239,26 @@ class DemandBuilder:
             )
         return self.injection_shares_by_year[year]
 
+    def _build_demand_index(self):
+        """Index demand rows by (year, week_number); the first row wins for duplicate keys."""
+        df = self.demand_df
+        self._demand_by_week: dict[tuple, tuple] = {}
+
+        for key, values in zip(
+                zip(df["year"].tolist(), df["week_number"].tolist()),
+                zip(df["daily_pkgs"].tolist(), df["mm_share"].tolist(),
+                    df["zs_share"].tolist(), df["di_share"].tolist())
+        ):
+            self._demand_by_week.setdefault(key, values)
+
     def _get_demand_params(self, year: int, week_number: int) -> dict:
         """Get demand parameters for year/week_number."""
-        mask = (self.demand_df["year"] == year) & (self.demand_df["week_number"] == week_number)
-        week_demand = self.demand_df[mask]
+        row = self._demand_by_week.get((year, week_number))
 
-        if len(week_demand) == 0:
+        if row is None:
             raise ValueError(f"No demand data for year={year}, week_number={week_number}")
 
-        row = week_demand.iloc[0]
-        daily_pkgs = float(row['daily_pkgs'])
-        mm_share = float(row['mm_share'])
-        zs_share = float(row['zs_share'])
-        di_share = float(row['di_share'])
+        daily_pkgs, mm_share, zs_share, di_share = (float(v) for v in row)
 
         # Validate shares sum to 1.0
         total_share = mm_share + zs_share + di_share
@@ -242,29 +278,25 @@ class DemandBuilder:
 
     def _calculate_zone(self, origin: str, dest: str) -> int:
         """Calculate zone from distance between facilities."""
-        origin_fac = self.facilities[origin]
-        dest_fac = self.facilities[dest]
-
-        distance = haversine_miles(
-            origin_fac.lat, origin_fac.lon,
-            dest_fac.lat, dest_fac.lon
-        )
-
-        band = get_zone_for_distance(distance, self.mileage_bands)
-        if band:
-            return band.zone
-
-        return self.mileage_bands[-1].zone if self.mileage_bands else 1
+        return int(self._zone_lookup[self._fac_idx[origin], self._fac_idx[dest]])
 
     def build_demands(self) -> list[ODDemand]:
         """Build OD demand list for all scenarios."""
         demands = []
 
-        for _, scenario in self.scenarios_df.iterrows():
-            scenario_id = str(scenario["scenario_id"])
-            year = int(scenario["year"])
-            week_number = int(scenario["week_number"])
-            demand_source = str(scenario.get("demand_source", "population")).lower().strip()
+        scenarios = self.scenarios_df
+        if "demand_source" in scenarios.columns:
+            demand_sources = scenarios["demand_source"].tolist()
+        else:
+            demand_sources = ["population"] * len(scenarios)
+
+        for scenario_id, year, week_number, demand_source in zip(
+                scenarios["scenario_id"].astype(str), scenarios["year"].tolist(),
+                scenarios["week_number"].tolist(), demand_sources
+        ):
+            year = int(year)
+            week_number = int(week_number)
+            demand_source = str(demand_source).lower().strip()
 
             logger.info(
                 f"Building demand for scenario {scenario_id} "
@@ -321,10 +353,12 @@ class DemandBuilder:
         zero_demand_pairs = 0
         total_input_pairs = len(forecast)
 
-        for _, row in forecast.iterrows():
-            origin_market = str(row['origin_market']).strip()
-            dest_market = str(row['dest_market']).strip()
-            pkgs_day = float(row['pkgs_day'])
+        for origin_market, dest_market, pkgs_day in zip(
+                forecast['origin_market'].tolist(), forecast['dest_market'].tolist(), forecast['pkgs_day'].tolist()
+        ):
+            origin_market = str(origin_market).strip()
+            dest_market = str(dest_market).strip()
+            pkgs_day = float(pkgs_day)
 
             # Skip zero/near-zero demand - keeps input clean while filtering for model
             if pkgs_day < 0.01:
@@ -428,14 +462,14 @@ class DemandBuilder:
             raise ValueError(f"Zero or negative daily demand for scenario {scenario_id}")
 
         # Build destination shares for this year
-        dest_shares = self._build_destination_shares_for_year(year)
-        if not dest_shares:
+        dest_names, dest_share = self._build_destination_shares_for_year(year)
+        if not dest_names:
             raise ValueError(
                 f"No destination facilities found for year {year}. "
                 f"Check that facility_{year} column has valid facility names."
             )
 
-        scenario_demands = self._build_od_matrix(scenario_id, params, week_number, dest_shares, year)
+        scenario_demands = self._build_od_matrix(scenario_id, params, week_number, dest_names, dest_share, year)
 
         # Log summary by flow type
         mm_pkgs = sum(d.pkgs_day for d in scenario_demands if d.flow_type == FlowType.MIDDLE_MILE)
@@ -451,7 +485,7 @@ class DemandBuilder:
             f"ZS: {zs_pkgs:,.0f} ({100*zs_pkgs/daily_pkgs:.1f}%), "
             f"DI: {di_pkgs:,.0f} ({100*di_pkgs/daily_pkgs:.1f}%)"
         )
-        logger.info(f"    Active destinations: {len(dest_shares)} facilities")
+        logger.info(f"    Active destinations: {len(dest_names)} facilities")
 
         return scenario_demands
 
@@ -460,38 +494,39 @@ class DemandBuilder:
             scenario_id: str,
             params: dict,
             week_number: int,
-            dest_shares: dict[str, float],
+            dest_names: list[str],
+            dest_share: np.ndarray,
             year: int
     ) -> list[ODDemand]:
         """Build OD matrix for a single scenario using population-based approach."""
         demands = []
         daily_pkgs = params['daily_pkgs']
 
-        # 1. DIRECT INJECTION: O=D at facility assigned for this year (zone 0)
-        di_daily = daily_pkgs * params['di_share']
-        if di_daily > 0:
-            for dest, dest_share in dest_shares.items():
-                di_pkgs = di_daily * dest_share
-                if di_pkgs < 0.01:
-                    continue
-                if dest not in self.facilities:
-                    continue
-
-                demands.append(ODDemand(
-                    scenario_id=scenario_id,
-                    origin=dest,  # O=D
-                    dest=dest,
-                    pkgs_day=di_pkgs,
-                    zone=0,
-                    flow_type=FlowType.DIRECT_INJECTION,
-                    week_number=week_number
-                ))
+        # Destinations without a facility record get no demand
+        known = [dest in self.facilities for dest in dest_names]
+        dests = [dest for dest, ok in zip(dest_names, known) if ok]
+        shares = dest_share[np.array(known, dtype=bool)]
 
+        # 1. DIRECT INJECTION: O=D at facility assigned for this year (zone 0)
         # 2. ZONE SKIP: Origin = regional_sort_hub of dest, Dest = facility assigned for year
+        # Both flows come from one pass over destinations; ZS records still follow all DI records.
+        di_daily = daily_pkgs * params['di_share']
         zs_daily = daily_pkgs * params['zs_share']
-        if zs_daily > 0:
-            for dest, dest_share in dest_shares.items():
-                if dest not in self.facilities:
+        zs_demands = []
+        if di_daily > 0 or zs_daily > 0:
+            for dest, di_pkgs, zs_pkgs in zip(dests, (di_daily * shares).tolist(), (zs_daily * shares).tolist()):
+                if di_daily > 0 and di_pkgs >= 0.01:
+                    demands.append(ODDemand(
+                        scenario_id=scenario_id,
+                        origin=dest,  # O=D
+                        dest=dest,
+                        pkgs_day=di_pkgs,
+                        zone=0,
+                        flow_type=FlowType.DIRECT_INJECTION,
+                        week_number=week_number
+                    ))
+
+                if zs_daily <= 0:
                     continue
 
                 # Get regional_sort_hub for this destination
@@ -504,14 +539,13 @@ class DemandBuilder:
                     logger.warning(f"Regional hub {regional_hub} not in facilities")
                     continue
 
-                zs_pkgs = zs_daily * dest_share
                 if zs_pkgs < 0.01:
                     continue
 
                 # Zone skip always uses mileage bands (zone 0 reserved for direct injection)
                 zone = self._calculate_zone(regional_hub, dest)
 
-                demands.append(ODDemand(
+                zs_demands.append(ODDemand(
                     scenario_id=scenario_id,
                     origin=regional_hub,
                     dest=dest,
@@ -521,43 +555,42 @@ class DemandBuilder:
                     week_number=week_number
                 ))
 
+        demands.extend(zs_demands)
+
         # 3. MIDDLE MILE: Origin = per injection_distribution (year-specific), Dest = per population
         mm_daily = daily_pkgs * params['mm_share']
         if mm_daily > 0:
             injection_shares = self._get_injection_shares(year)
 
-            for origin, inj_share in injection_shares.items():
-                if inj_share < 0.0001:
-                    continue
+            origins = [origin for origin, inj_share in injection_shares.items() if inj_share >= 0.0001]
+            for origin in origins:
                 if origin not in self.facilities:
                     raise ValueError(f"Unknown injection facility: {origin}")
 
-                origin_mm = mm_daily * inj_share
-
-                for dest, dest_share in dest_shares.items():
-                    od_pkgs = origin_mm * dest_share
-                    if od_pkgs < 0.01:
-                        continue
-                    if dest not in self.facilities:
-                        continue
-
-                    # O=D only allowed for hybrid facilities
-                    if origin == dest:
-                        fac_type = self.facilities[origin].facility_type
-                        if fac_type != FacilityType.HYBRID:
-                            continue
-
-                    zone = self._calculate_zone(origin, dest)
-
-                    demands.append(ODDemand(
-                        scenario_id=scenario_id,
-                        origin=origin,
-                        dest=dest,
-                        pkgs_day=od_pkgs,
-                        zone=zone,
-                        flow_type=FlowType.MIDDLE_MILE,
-                        week_number=week_number
-                    ))
+            # origin_mm[i] * dest_share[j] for every pair in one outer product
+            origin_mm = mm_daily * np.array([injection_shares[o] for o in origins], dtype=float)
+            od_pkgs = np.outer(origin_mm, shares)
+            keep = od_pkgs >= 0.01
+
+            # O=D only allowed for hybrid facilities
+            origin_idx = np.array([self._fac_idx[o] for o in origins], dtype=np.int64)
+            dest_idx = np.array([self._fac_idx[d] for d in dests], dtype=np.int64)
+            keep &= ~((origin_idx[:, None] == dest_idx[None, :]) & ~self._is_hybrid[origin_idx][:, None])
+
+            # np.nonzero walks row-major, so demands keep origin-then-dest order
+            rows, cols = np.nonzero(keep)
+            for i, j, pkgs in zip(rows.tolist(), cols.tolist(), od_pkgs[rows, cols].tolist()):
+                origin = origins[i]
+                dest = dests[j]
+                demands.append(ODDemand(
+                    scenario_id=scenario_id,
+                    origin=origin,
+                    dest=dest,
+                    pkgs_day=pkgs,
+                    zone=self._calculate_zone(origin, dest),
+                    flow_type=FlowType.MIDDLE_MILE,
+                    week_number=week_number
+                ))
 
         return demands
 
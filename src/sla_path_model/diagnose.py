@@ -21,12 +21,11 @@ SHOW_ALL_DETAILS = False      # True = show detailed breakdown for ALL paths (ov
 INPUT_FILE = r"C:\Users\ChrisRallis\Desktop\python_projects\sla_path_model_v1\data\input_sla_model_v1.xlsx"
 # ===========================================
 
-from datetime import datetime, timedelta
-from typing import Optional
+from datetime import datetime
 
 from sla_path_model.config import (
     PathCandidate, PathTimingResult, PathType, SortLevel, StepType,
-    FacilityType, FlowType, Facility
+    FacilityType, Facility
 )
 from sla_path_model.io_loader import InputLoader
 from sla_path_model.path_enumeration import PathEnumerator
@@ -39,17 +38,12 @@ from sla_path_model.time_utils import utc_to_local
 
 def get_tz_abbrev(facility: Facility, dt_utc: datetime) -> str:
     """Get timezone abbreviation (EST/EDT, PST/PDT, etc.) for a given UTC datetime."""
-    local_dt = dt_utc.replace(tzinfo=None)
-    local_dt = utc_to_local(dt_utc, facility.timezone)
-    # Get the timezone abbreviation
-    return local_dt.strftime("%Z") if hasattr(local_dt, 'strftime') else str(facility.timezone)
+    return utc_to_local(dt_utc, facility.timezone).strftime("%Z")
 
 
 def format_local_time(dt_utc: datetime, facility: Facility) -> str:
     """Format UTC datetime as local time with day and timezone."""
-    local_dt = utc_to_local(dt_utc, facility.timezone)
-    tz_abbrev = local_dt.strftime("%Z")
-    return f"{local_dt.strftime('%a %H:%M')} {tz_abbrev}"
+    return utc_to_local(dt_utc, facility.timezone).strftime("%a %H:%M %Z")
 
 
 def format_window(start_local, end_local) -> str:
@@ -59,11 +53,17 @@ def format_window(start_local, end_local) -> str:
     return f"{start_local.strftime('%H:%M')}-{end_local.strftime('%H:%M')}"
 
 
+def write_lines(lines: list[str]):
+    """Write a section's lines to stdout in one call rather than one print per line."""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def print_summary_table(timings: list[PathTimingResult], facilities: dict[str, Facility]):
     """Print compact summary table of all paths."""
-    print()
-    print(f"  #  Path Type         Sort Lvl    Dest Sort   Nodes                                TNT(hrs)  SLA     Slack")
-    print(f"  -  ---------         --------    ---------   -----                                --------  ---     -----")
+    lines = []
+    lines.append("")
+    lines.append(f"  #  Path Type         Sort Lvl    Dest Sort   Nodes                                TNT(hrs)  SLA     Slack")
+    lines.append(f"  -  ---------         --------    ---------   -----                                --------  ---     -----")
 
     for i, timing in enumerate(timings, 1):
         path = timing.path
@@ -74,30 +74,33 @@ def print_summary_table(timings: list[PathTimingResult], facilities: dict[str, F
         sla_status = "MET" if timing.sla_met else "MISS"
         slack_sign = "+" if timing.sla_slack_hours >= 0 else ""
 
-        print(f"  {i:<2} {path.path_type.value:<17} {path.sort_level.value:<11} {path.dest_sort_level.value:<11} "
+        lines.append(f"  {i:<2} {path.path_type.value:<17} {path.sort_level.value:<11} {path.dest_sort_level.value:<11} "
               f"{nodes_str:<36} {timing.tnt_hours:>6.1f}    {sla_status:<6}  {slack_sign}{timing.sla_slack_hours:.1f}")
 
+    write_lines(lines)
+
 
 def print_detailed_breakdown(timing: PathTimingResult, facilities: dict[str, Facility], path_num: int):
     """Print detailed step-by-step breakdown for a single path."""
+    lines = []
     path = timing.path
     origin_fac = facilities[path.origin]
     dest_fac = facilities[path.dest]
 
-    print()
-    print(f"{'='*90}")
-    print(f"=== DETAILED BREAKDOWN: Path #{path_num} ({path.path_type.value}, {path.sort_level.value}) ===")
-    print(f"{'='*90}")
-    print()
-    print(f"Route: {' → '.join(path.path_nodes)}")
-    print(f"Origin: {path.origin} ({origin_fac.facility_type.value}) - {origin_fac.timezone}")
-    print(f"Dest:   {path.dest} ({dest_fac.facility_type.value}) - {dest_fac.timezone}")
-    print(f"Direct miles: {path.direct_miles:.1f}, Path miles: {path.total_path_miles:.1f}, ATW: {path.atw_factor:.2f}")
-    print()
+    lines.append("")
+    lines.append(f"{'='*90}")
+    lines.append(f"=== DETAILED BREAKDOWN: Path #{path_num} ({path.path_type.value}, {path.sort_level.value}) ===")
+    lines.append(f"{'='*90}")
+    lines.append("")
+    lines.append(f"Route: {' → '.join(path.path_nodes)}")
+    lines.append(f"Origin: {path.origin} ({origin_fac.facility_type.value}) - {origin_fac.timezone}")
+    lines.append(f"Dest:   {path.dest} ({dest_fac.facility_type.value}) - {dest_fac.timezone}")
+    lines.append(f"Direct miles: {path.direct_miles:.1f}, Path miles: {path.total_path_miles:.1f}, ATW: {path.atw_factor:.2f}")
+    lines.append("")
 
     # Header
-    print(f"Step  Type                Facility        Start (local)       End (local)         Dur(min)  Dwell(min)  Notes")
-    print(f"────  ────                ────────        ─────────────       ───────────         ────────  ──────────  ─────")
+    lines.append(f"Step  Type                Facility        Start (local)       End (local)         Dur(min)  Dwell(min)  Notes")
+    lines.append(f"────  ────                ────────        ─────────────       ───────────         ────────  ──────────  ─────")
 
     # Track sort/transit/dwell totals
     total_sort_mins = 0
@@ -184,11 +187,11 @@ def print_detailed_breakdown(timing: PathTimingResult, facilities: dict[str, Fac
         else:
             dwell_str = "0"
 
-        print(f"  {step.step_sequence:<3} {step.step_type.value:<19} {facility_str:<15} "
+        lines.append(f"  {step.step_sequence:<3} {step.step_type.value:<19} {facility_str:<15} "
               f"{start_str:<19} {end_str:<19} {step.duration_minutes:>6.0f}    {dwell_str:<10}  {notes}")
 
     # Summary line
-    print()
+    lines.append("")
     sort_hrs = total_sort_mins / 60
     transit_hrs = total_transit_mins / 60
     crossdock_hrs = total_crossdock_mins / 60
@@ -196,13 +199,15 @@ def print_detailed_breakdown(timing: PathTimingResult, facilities: dict[str, Fac
     cpt_dwell_hrs = total_cpt_dwell / 60
     total_dwell_hrs = window_dwell_hrs + cpt_dwell_hrs
 
-    print(f"Summary: Sort={sort_hrs:.1f}h, Crossdock={crossdock_hrs:.1f}h, Transit={transit_hrs:.1f}h, "
+    lines.append(f"Summary: Sort={sort_hrs:.1f}h, Crossdock={crossdock_hrs:.1f}h, Transit={transit_hrs:.1f}h, "
           f"Dwell={total_dwell_hrs:.1f}h (win:{window_dwell_hrs:.1f}, cpt:{cpt_dwell_hrs:.1f}) → TNT={timing.tnt_hours:.1f}h")
 
     sla_status = "MET" if timing.sla_met else "MISS"
     slack_sign = "+" if timing.sla_slack_hours >= 0 else ""
-    print(f"SLA: {timing.sla_days} day(s) = {timing.sla_target_hours:.1f}h target → {sla_status} ({slack_sign}{timing.sla_slack_hours:.1f}h slack)")
-    print(f"Uses only active arcs: {timing.uses_only_active_arcs}")
+    lines.append(f"SLA: {timing.sla_days} day(s) = {timing.sla_target_hours:.1f}h target → {sla_status} ({slack_sign}{timing.sla_slack_hours:.1f}h slack)")
+    lines.append(f"Uses only active arcs: {timing.uses_only_active_arcs}")
+
+    write_lines(lines)
 
 
 def main():
@@ -3,8 +3,10 @@ Feasibility: SLA checking and path filtering.
 """
 from typing import Optional
 
+import numpy as np
+
 from .config import (
-    PathTimingResult, ServiceCommitment, ODDemand, FlowType,
+    PathTimingResult, ServiceCommitment, ODDemand,
     HOURS_PER_DAY
 )
 from .utils import setup_logging
@@ -20,6 +22,7 @@ class FeasibilityChecker:
 
         # Index commitments for fast lookup
         self._build_commitment_index()
+        self._build_commitment_arrays()
 
     def _build_commitment_index(self):
         """Build index for efficient commitment lookup."""
@@ -36,6 +39,9 @@ class FeasibilityChecker:
         self.zone_commitments = {}  # zone -> ServiceCommitment
         self.default_commitment = None
 
+        # Resolved commitment per (origin, dest, zone), filled by get_commitment
+        self._resolved: dict[tuple[str, str, int], Optional[ServiceCommitment]] = {}
+
         for sc in self.service_commitments:
             if sc.origin != "*" and sc.dest != "*":
                 # Specific OD pair
@@ -53,6 +59,78 @@ class FeasibilityChecker:
                 # Default
                 self.default_commitment = sc
 
+    def _build_commitment_arrays(self):
+        """
+        Build column arrays of commitments for batch matching in resolve_commitments.
+
+        Rows are stored most-specific first, so the first matching row is the
+        winning commitment and no scoring is needed at match time.
+        """
+        n = len(self.service_commitments)
+
+        # Specificity tier follows get_commitment priority: OD > origin > dest > zone > default.
+        # Within a tier later entries win, matching dict overwrite order.
+        tier = np.array([self._specificity_tier(sc) for sc in self.service_commitments], dtype=np.int64)
+        order = np.lexsort((-np.arange(n), -tier))
+        commitments = [self.service_commitments[i] for i in order.tolist()]
+        self._c_commitments = commitments
+
+        self._c_origin = np.array([sc.origin for sc in commitments], dtype=str)
+        self._c_dest = np.array([sc.dest for sc in commitments], dtype=str)
+        self._c_zone = np.array([sc.zone if sc.zone is not None else 0 for sc in commitments], dtype=np.int64)
+
+        self._c_origin_any = self._c_origin == "*"
+        self._c_dest_any = self._c_dest == "*"
+        # Zone only discriminates for wildcard commitments (same as the dict index)
+        has_zone = np.array([sc.zone is not None for sc in commitments], dtype=bool)
+        self._c_zone_any = ~(has_zone & self._c_origin_any & self._c_dest_any)
+
+    @staticmethod
+    def _specificity_tier(sc: ServiceCommitment) -> int:
+        if sc.origin != "*" and sc.dest != "*":
+            return 4
+        if sc.origin != "*":
+            return 3
+        if sc.dest != "*":
+            return 2
+        if sc.zone is not None:
+            return 1
+        return 0
+
+    def resolve_commitments(
+            self,
+            origins: list[str],
+            dests: list[str],
+            zones: list[int]
+    ) -> list[Optional[ServiceCommitment]]:
+        """
+        Resolve the applicable commitment for many OD/zone rows at once.
+
+        Same result as calling get_commitment per row, but every commitment is
+        matched against every row with NumPy masks and the first (most
+        specific) match is picked with a single argmax.
+        """
+        num_rows = len(origins)
+        if num_rows == 0 or not self.service_commitments:
+            return [None] * num_rows
+
+        origins = np.asarray(origins, dtype=str)
+        dests = np.asarray(dests, dtype=str)
+        zones = np.asarray(zones, dtype=np.int64)
+
+        matched = (
+            (self._c_origin_any[:, None] | (self._c_origin[:, None] == origins[None, :])) &
+            (self._c_dest_any[:, None] | (self._c_dest[:, None] == dests[None, :])) &
+            (self._c_zone_any[:, None] | (self._c_zone[:, None] == zones[None, :]))
+        )
+        best = matched.argmax(axis=0)
+        has_match = matched[best, np.arange(num_rows)]
+
+        return [
+            self._c_commitments[i] if ok else None
+            for i, ok in zip(best.tolist(), has_match.tolist())
+        ]
+
     def get_commitment(
             self,
             origin: str,
@@ -68,7 +146,24 @@ class FeasibilityChecker:
         3. Dest-specific
         4. Zone-based
         5. Default
+
+        Results are memoized per (origin, dest, zone), so repeat lookups are
+        a single dict probe.
         """
+        key = (origin, dest, zone)
+        if key in self._resolved:
+            return self._resolved[key]
+
+        commitment = self._lookup_commitment(origin, dest, zone)
+        self._resolved[key] = commitment
+        return commitment
+
+    def _lookup_commitment(
+            self,
+            origin: str,
+            dest: str,
+            zone: int
+    ) -> Optional[ServiceCommitment]:
         # Check specific OD
         if (origin, dest) in self.od_commitments:
             return self.od_commitments[(origin, dest)]
@@ -108,33 +203,58 @@ class FeasibilityChecker:
             timing.path.dest,
             zone
         )
+        return self.apply_commitment(timing, commitment)
+
+    def apply_commitment(
+            self,
+            timing: PathTimingResult,
+            commitment: Optional[ServiceCommitment]
+    ) -> PathTimingResult:
+        """Populate SLA fields on a timing result from an already-resolved commitment."""
+        self.assign_commitment(timing, commitment)
 
         if commitment is None:
             # No commitment defined - assume met
-            timing.sla_days = 0
-            timing.sla_buffer_days = 0
-            timing.sla_target_hours = float('inf')
             timing.sla_met = True
             timing.sla_slack_hours = float('inf')
-            timing.priority_weight = 1.0
             return timing
 
-        # Calculate SLA target in hours
-        sla_target_hours = (commitment.sla_days + commitment.sla_buffer_days) * HOURS_PER_DAY
-
         # Check if path meets SLA
-        sla_met = timing.tnt_hours <= sla_target_hours
-        sla_slack_hours = sla_target_hours - timing.tnt_hours
+        timing.sla_met = timing.tnt_hours <= timing.sla_target_hours
+        timing.sla_slack_hours = timing.sla_target_hours - timing.tnt_hours
+
+        return timing
+
+    @staticmethod
+    def assign_commitment(
+            timing: PathTimingResult,
+            commitment: Optional[ServiceCommitment]
+    ) -> None:
+        """Copy commitment terms onto a timing result without scoring it (see score_sla)."""
+        if commitment is None:
+            timing.sla_days = 0
+            timing.sla_buffer_days = 0
+            timing.sla_target_hours = float('inf')
+            timing.priority_weight = 1.0
+            return
 
-        # Update timing result
         timing.sla_days = commitment.sla_days
         timing.sla_buffer_days = commitment.sla_buffer_days
-        timing.sla_target_hours = sla_target_hours
-        timing.sla_met = sla_met
-        timing.sla_slack_hours = sla_slack_hours
+        timing.sla_target_hours = (commitment.sla_days + commitment.sla_buffer_days) * HOURS_PER_DAY
         timing.priority_weight = commitment.priority_weight
 
-        return timing
+
+def score_sla(tnt_hours: np.ndarray, sla_target_hours: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized SLA check over all paths.
+
+    Returns (sla_met, sla_slack_hours). An infinite target means no commitment
+    applies: the path always meets SLA with infinite slack.
+    """
+    no_target = np.isposinf(sla_target_hours)
+    sla_met = (tnt_hours <= sla_target_hours) | no_target
+    sla_slack_hours = np.where(no_target, np.inf, sla_target_hours - tnt_hours)
+    return sla_met, sla_slack_hours
 
 
 def check_all_feasibility(
@@ -166,21 +286,32 @@ def check_all_feasibility(
         if key not in od_zones or demand.zone > 0:
             od_zones[key] = demand.zone
 
-    # Check each path
-    total_paths = sum(len(timings) for timings in od_timings.values())
-    paths_met = 0
-    paths_missed = 0
-
-    for (origin, dest), timings in od_timings.items():
-        zone = od_zones.get((origin, dest), 1)  # Default to zone 1
+    # Resolve commitments for every OD in one batch instead of once per path
+    od_keys = list(od_timings.keys())
+    commitments = checker.resolve_commitments(
+        [origin for origin, _ in od_keys],
+        [dest for _, dest in od_keys],
+        [od_zones.get(key, 1) for key in od_keys]  # Default to zone 1
+    )
 
+    all_timings = []
+    for key, commitment in zip(od_keys, commitments):
+        timings = od_timings[key]
         for timing in timings:
-            checker.check_feasibility(timing, zone)
+            checker.assign_commitment(timing, commitment)
+        all_timings.extend(timings)
 
-            if timing.sla_met:
-                paths_met += 1
-            else:
-                paths_missed += 1
+    # Score every path in one vectorized pass
+    total_paths = len(all_timings)
+    tnt_hours = np.fromiter((t.tnt_hours for t in all_timings), dtype=float, count=total_paths)
+    sla_target_hours = np.fromiter((t.sla_target_hours for t in all_timings), dtype=float, count=total_paths)
+    sla_met, sla_slack_hours = score_sla(tnt_hours, sla_target_hours)
+
+    for timing, met, slack in zip(all_timings, sla_met.tolist(), sla_slack_hours.tolist()):
+        timing.sla_met = met
+        timing.sla_slack_hours = slack
+
+    paths_met = int(sla_met.sum())
 
     logger.info(
         f"Feasibility check complete: {paths_met}/{total_paths} paths meet SLA "
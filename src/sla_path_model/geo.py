@@ -1,29 +1,64 @@
 """Geographic calculations: haversine distance, transit time, zone determination."""
 import math
+from bisect import bisect_right
 from typing import Optional
 
+import numpy as np
+
 from .config import EARTH_RADIUS_MILES, MileageBand, MINUTES_PER_HOUR
 
 
 def haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """Calculate great-circle distance between two points."""
-    lat1_r = math.radians(lat1)
-    lat2_r = math.radians(lat2)
+    return haversine_miles_cos(
+        lat1, lon1, math.cos(math.radians(lat1)),
+        lat2, lon2, math.cos(math.radians(lat2))
+    )
+
+
+def haversine_miles_cos(
+    lat1: float, lon1: float, cos_lat1: float,
+    lat2: float, lon2: float, cos_lat2: float
+) -> float:
+    """haversine_miles with each point's cos(latitude) supplied by the caller."""
     dlat = math.radians(lat2 - lat1)
     dlon = math.radians(lon2 - lon1)
 
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1_r) * math.cos(lat2_r) * math.sin(dlon / 2) ** 2
+    a = math.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * math.sin(dlon / 2) ** 2
     c = 2 * math.asin(math.sqrt(a))
 
     return EARTH_RADIUS_MILES * c
 
 
+def haversine_miles_batch(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Element-wise haversine_miles over NumPy arrays (broadcasting like any ufunc)."""
+    lat1_r = np.radians(lat1)
+    lat2_r = np.radians(lat2)
+    dlat = np.radians(lat2 - lat1)
+    dlon = np.radians(lon2 - lon1)
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1_r) * np.cos(lat2_r) * np.sin(dlon / 2) ** 2
+    c = 2 * np.arcsin(np.sqrt(a))
+
+    return EARTH_RADIUS_MILES * c
+
+
+def haversine_miles_matrix(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    """Great-circle distance between every pair of points, as an N x N array."""
+    return haversine_miles_batch(lat[:, None], lon[:, None], lat[None, :], lon[None, :])
+
+
 def get_zone_for_distance(distance_miles: float, mileage_bands: list[MileageBand]) -> Optional[MileageBand]:
     """
     Determine zone for a distance. Uses lower bound inclusive, upper bound exclusive.
     Example: zone 1 = 0-150, zone 2 = 150-300 means 150 miles falls into zone 2.
+
+    Bands must be sorted and non-overlapping (enforced by validate_mileage_bands),
+    so the only candidate is the last band starting at or below the distance.
     """
-    for band in mileage_bands:
+    idx = bisect_right(mileage_bands, distance_miles, key=lambda b: b.mileage_band_min) - 1
+    if idx >= 0:
+        band = mileage_bands[idx]
         if band.mileage_band_min <= distance_miles < band.mileage_band_max:
             return band
 
@@ -38,6 +73,31 @@ def get_zone_for_distance(distance_miles: float, mileage_bands: list[MileageBand
     return None
 
 
+def get_zones_for_distances(distances: np.ndarray, mileage_bands: list[MileageBand]) -> np.ndarray:
+    """
+    Zone for every distance in an array, same rules as get_zone_for_distance.
+
+    Bands must be sorted and non-overlapping (enforced by validate_mileage_bands),
+    so each distance is placed with one binary search over the band upper bounds.
+    Distances outside every band (gaps, past the last band) get the last
+    band's zone; with no bands at all every distance is zone 1.
+    """
+    if not mileage_bands:
+        return np.ones(distances.shape, dtype=np.int64)
+
+    band_min = np.array([b.mileage_band_min for b in mileage_bands], dtype=float)
+    band_max = np.array([b.mileage_band_max for b in mileage_bands], dtype=float)
+    band_zone = np.array([b.zone for b in mileage_bands], dtype=np.int64)
+
+    # First band whose (exclusive) upper bound is above the distance
+    idx = np.searchsorted(band_max, distances, side="right")
+    in_range = idx < len(mileage_bands)
+    idx = np.minimum(idx, len(mileage_bands) - 1)
+    in_band = in_range & (band_min[idx] <= distances)
+
+    return np.where(in_band, band_zone[idx], band_zone[-1])
+
+
 def calculate_transit_time_minutes(
     distance_miles: float,
     circuity_factor: float,
@@ -75,4 +135,59 @@ def calculate_path_distance(
         dist = haversine_miles(origin.lat, origin.lon, dest.lat, dest.lon)
         leg_miles.append(dist)
 
-    return sum(leg_miles), leg_miles
\ No newline at end of file
+    return sum(leg_miles), leg_miles
+
+
+class DistanceCache:
+    """
+    Memoized haversine distances between named facilities.
+
+    Enumeration and timing revisit the same facility pairs for every OD,
+    so each pair is computed once and then served from a dict. Haversine is
+    symmetric, so computing a leg also fills in its reverse. Each facility's
+    cos(latitude) is computed once and shared by every leg touching it.
+    """
+
+    def __init__(self, facilities: dict):
+        self.facilities = facilities
+        self._miles: dict[tuple[str, str], float] = {}
+        self._cos_lat: dict[str, float] = {}
+
+    def _facility_cos_lat(self, name: str) -> float:
+        cos_lat = self._cos_lat.get(name)
+        if cos_lat is None:
+            cos_lat = math.cos(math.radians(self.facilities[name].lat))
+            self._cos_lat[name] = cos_lat
+        return cos_lat
+
+    def miles(self, origin: str, dest: str) -> float:
+        key = (origin, dest)
+        dist = self._miles.get(key)
+        if dist is None:
+            o = self.facilities[origin]
+            d = self.facilities[dest]
+            dist = haversine_miles_cos(
+                o.lat, o.lon, self._facility_cos_lat(origin),
+                d.lat, d.lon, self._facility_cos_lat(dest)
+            )
+            self._miles[key] = dist
+            self._miles[(dest, origin)] = dist
+        return dist
+
+    def path_distance(self, path_nodes: list[str]) -> tuple[float, list[float]]:
+        """Same result as calculate_path_distance, using cached leg distances."""
+        num_nodes = len(path_nodes)
+        if num_nodes < 2:
+            return 0.0, []
+
+        # Direct and one-hop paths dominate enumeration; skip the generic loop for them
+        if num_nodes == 2:
+            dist = self.miles(path_nodes[0], path_nodes[1])
+            return dist, [dist]
+        if num_nodes == 3:
+            first = self.miles(path_nodes[0], path_nodes[1])
+            second = self.miles(path_nodes[1], path_nodes[2])
+            return first + second, [first, second]
+
+        leg_miles = [self.miles(path_nodes[i], path_nodes[i + 1]) for i in range(len(path_nodes) - 1)]
+        return sum(leg_miles), leg_miles
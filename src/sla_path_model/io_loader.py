@@ -1,3 +1,6 @@
+import hashlib
+import pickle
+import sys
 from datetime import datetime, time
 from pathlib import Path
 from typing import Optional
@@ -5,6 +8,7 @@ from zoneinfo import ZoneInfo
 
 import pandas as pd
 
+from . import __version__
 from .config import (
     Facility, FacilityType, MileageBand, ServiceCommitment, TimingParams,
     RunSettings, ObjectiveType, CPT, DemandSource, parse_enabled_sort_levels
@@ -26,43 +30,91 @@ class InputLoader:
         "service_commitments",
         "run_settings"
     ]
+    OPTIONAL_SHEETS = [
+        "arc_cpts",
+        "market_demand"
+    ]
 
     def __init__(self, filepath: str):
         self.filepath = Path(filepath)
         if not self.filepath.exists():
             raise FileNotFoundError(f"Input file not found: {filepath}")
 
-        self.excel = pd.ExcelFile(filepath)
+        self.excel = self._open_workbook(filepath)
+        self.engine = self.excel.engine
+        self.sheet_names = list(self.excel.sheet_names)
         self._validate_required_sheets()
 
+        # Parsed sheets waiting to be consumed by a load_* method (see _read_all_sheets)
+        self._sheets: dict[str, pd.DataFrame] = {}
+
+    @staticmethod
+    def _open_workbook(filepath) -> pd.ExcelFile:
+        """
+        Open the workbook with the calamine reader when available, else pandas' default.
+
+        calamine (Rust) parses xlsx several times faster than openpyxl. It needs
+        the optional python-calamine package and pandas >= 2.2; without them
+        pandas raises ImportError/ValueError and openpyxl is used as before.
+        """
+        try:
+            return pd.ExcelFile(filepath, engine="calamine")
+        except (ImportError, ValueError):
+            return pd.ExcelFile(filepath)
+
     def _validate_required_sheets(self):
-        missing = [s for s in self.REQUIRED_SHEETS if s not in self.excel.sheet_names]
+        missing = [s for s in self.REQUIRED_SHEETS if s not in self.sheet_names]
         if missing:
             raise ValueError(f"Missing required sheets: {missing}")
 
+    def _read_all_sheets(self):
+        """
+        Parse every sheet the model uses in a single pass, then release the workbook.
+
+        Each DataFrame is handed to its load_* method exactly once, so the
+        workbook does not stay resident for the rest of the run.
+        """
+        wanted = self.REQUIRED_SHEETS + [s for s in self.OPTIONAL_SHEETS if s in self.sheet_names]
+        self._sheets = pd.read_excel(self.excel, sheet_name=wanted)
+        self.excel.close()
+
+    def _read_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """Take a preloaded sheet, or parse it from the file when called outside load_all."""
+        if sheet_name in self._sheets:
+            return self._sheets.pop(sheet_name)
+        return pd.read_excel(self.filepath, sheet_name=sheet_name, engine=self.engine)
+
     def load_facilities(self) -> dict[str, Facility]:
-        df = pd.read_excel(self.excel, sheet_name="facilities")
+        df = self._read_sheet("facilities")
+        df["facility_name"] = df["facility_name"].astype(str).str.strip()
+        df["type"] = df["type"].astype(str).str.lower().str.strip()
 
         facilities = {}
-        for _, row in df.iterrows():
-            name = str(row["facility_name"]).strip()
-
-            try:
-                tz = ZoneInfo(row["timezone"])
-            except Exception as e:
-                raise ValueError(f"Invalid timezone '{row['timezone']}' for facility {name}: {e}")
+        timezones: dict[str, ZoneInfo] = {}  # One ZoneInfo per distinct timezone string
+        for row in df.to_dict(orient="records"):
+            # Names are interned so the many name comparisons and dict lookups in
+            # enumeration/timing hit the identity fast path
+            name = sys.intern(row["facility_name"])
+
+            tz = timezones.get(row["timezone"])
+            if tz is None:
+                try:
+                    tz = ZoneInfo(row["timezone"])
+                except Exception as e:
+                    raise ValueError(f"Invalid timezone '{row['timezone']}' for facility {name}: {e}")
+                timezones[row["timezone"]] = tz
 
             # Get market (used for commercial forecast mapping)
             market = str(row["market"]).strip() if pd.notna(row.get("market")) else None
 
             facility = Facility(
                 name=name,
-                facility_type=FacilityType(str(row["type"]).lower().strip()),
+                facility_type=FacilityType(row["type"]),
                 lat=float(row["lat"]),
                 lon=float(row["lon"]),
                 timezone=tz,
                 market=market,
-                regional_sort_hub=str(row["regional_sort_hub"]).strip() if pd.notna(
+                regional_sort_hub=sys.intern(str(row["regional_sort_hub"]).strip()) if pd.notna(
                     row.get("regional_sort_hub")) else None,
                 mm_sort_start_local=parse_time_value(row.get("mm_sort_start_local")),
                 mm_sort_end_local=parse_time_value(row.get("mm_sort_end_local")),
@@ -90,7 +142,7 @@ class InputLoader:
 
         Blank facility_YYYY = zip not in coverage for that year.
         """
-        df = pd.read_excel(self.excel, sheet_name="zips")
+        df = self._read_sheet("zips")
         df["zip"] = df["zip"].astype(str).str.zfill(5)
 
         # Validate at least one facility_YYYY column exists
@@ -118,7 +170,7 @@ class InputLoader:
         - year, week_number, daily_pkgs
         - mm_share, zs_share, di_share
         """
-        df = pd.read_excel(self.excel, sheet_name="demand")
+        df = self._read_sheet("demand")
 
         required_cols = [
             'year', 'week_number', 'daily_pkgs',
@@ -147,7 +199,7 @@ class InputLoader:
         return df
 
     def load_injection_distribution(self) -> pd.DataFrame:
-        df = pd.read_excel(self.excel, sheet_name="injection_distribution")
+        df = self._read_sheet("injection_distribution")
 
         # Validate facility_name column exists
         if 'facility_name' not in df.columns:
@@ -199,11 +251,11 @@ class InputLoader:
 
         Returns None if sheet doesn't exist.
         """
-        if "market_demand" not in self.excel.sheet_names:
+        if "market_demand" not in self.sheet_names:
             logger.info("No market_demand sheet found, will use population-based demand for 'population' scenarios")
             return None
 
-        df = pd.read_excel(self.excel, sheet_name="market_demand")
+        df = self._read_sheet("market_demand")
 
         required_cols = ['origin_market', 'dest_market', 'year', 'week_number', 'pkgs_day']
         missing = [c for c in required_cols if c not in df.columns]
@@ -227,7 +279,7 @@ class InputLoader:
         return df
 
     def load_scenarios(self) -> pd.DataFrame:
-        df = pd.read_excel(self.excel, sheet_name="scenarios")
+        df = self._read_sheet("scenarios")
 
         # Validate required columns
         required_cols = ['scenario_id', 'year', 'week_number']
@@ -265,31 +317,30 @@ class InputLoader:
             logger.info("No enabled_sort_levels column in scenarios - defaulting to all levels")
         else:
             # Validate values during load
-            for idx, row in df.iterrows():
-                raw = row.get('enabled_sort_levels')
+            for scenario_id, raw in zip(df['scenario_id'], df['enabled_sort_levels']):
                 try:
                     parsed = parse_enabled_sort_levels(raw)
                     logger.debug(
-                        f"Scenario '{row['scenario_id']}' enabled sort levels: "
+                        f"Scenario '{scenario_id}' enabled sort levels: "
                         f"{[sl.value for sl in parsed]}"
                     )
                 except ValueError as e:
-                    raise ValueError(f"Scenario '{row['scenario_id']}': {e}")
+                    raise ValueError(f"Scenario '{scenario_id}': {e}")
 
         logger.info(f"Loaded {len(df)} scenarios")
         return df
 
     def load_mileage_bands(self) -> list[MileageBand]:
-        df = pd.read_excel(self.excel, sheet_name="mileage_bands")
+        df = self._read_sheet("mileage_bands")
 
         bands = []
-        for _, row in df.iterrows():
+        for row in df.itertuples(index=False):
             band = MileageBand(
-                zone=int(row["zone"]),
-                mileage_band_min=float(row["mileage_band_min"]),
-                mileage_band_max=float(row["mileage_band_max"]),
-                circuity_factor=float(row["circuity_factor"]),
-                mph=float(row["mph"])
+                zone=int(row.zone),
+                mileage_band_min=float(row.mileage_band_min),
+                mileage_band_max=float(row.mileage_band_max),
+                circuity_factor=float(row.circuity_factor),
+                mph=float(row.mph)
             )
             bands.append(band)
 
@@ -298,13 +349,9 @@ class InputLoader:
         return bands
 
     def load_timing_params(self) -> TimingParams:
-        df = pd.read_excel(self.excel, sheet_name="timing_params")
+        df = self._read_sheet("timing_params")
 
-        params = {}
-        for _, row in df.iterrows():
-            key = str(row["key"]).strip()
-            value = float(row["value"])
-            params[key] = value
+        params = dict(zip(df["key"].astype(str).str.strip(), df["value"].astype(float)))
 
         required_keys = [
             "induction_sort_minutes",
@@ -330,16 +377,18 @@ class InputLoader:
         return timing
 
     def load_arc_cpts(self, facilities: dict[str, Facility]) -> list[CPT]:
-        if "arc_cpts" not in self.excel.sheet_names:
+        if "arc_cpts" not in self.sheet_names:
             logger.info("No arc_cpts sheet found, will generate CPTs from facility outbound windows")
             return []
 
-        df = pd.read_excel(self.excel, sheet_name="arc_cpts")
+        df = self._read_sheet("arc_cpts")
+        df["origin"] = df["origin"].astype(str).str.strip()
+        df["dest"] = df["dest"].astype(str).str.strip()
 
         cpts = []
-        for _, row in df.iterrows():
-            origin = str(row["origin"]).strip()
-            dest = str(row["dest"]).strip()
+        for row in df.itertuples(index=False):
+            origin = sys.intern(row.origin)
+            dest = sys.intern(row.dest)
 
             if origin not in facilities:
                 logger.warning(f"arc_cpts references unknown origin facility: {origin}, skipping")
@@ -350,11 +399,11 @@ class InputLoader:
             cpt = CPT(
                 origin=origin,
                 dest=dest,
-                cpt_sequence=int(row["cpt_sequence"]),
-                cpt_local=parse_time_value(row["cpt_local"]),
-                days_of_week=parse_days_of_week(row.get("days_of_week", "")),
+                cpt_sequence=int(row.cpt_sequence),
+                cpt_local=parse_time_value(row.cpt_local),
+                days_of_week=parse_days_of_week(getattr(row, "days_of_week", "")),
                 timezone=tz,
-                is_active=bool(int(row["active_arc"]))
+                is_active=bool(int(row.active_arc))
             )
             cpts.append(cpt)
 
@@ -362,17 +411,20 @@ class InputLoader:
         return cpts
 
     def load_service_commitments(self) -> list[ServiceCommitment]:
-        df = pd.read_excel(self.excel, sheet_name="service_commitments")
+        df = self._read_sheet("service_commitments")
+        df["origin"] = df["origin"].astype(str).str.strip()
+        df["dest"] = df["dest"].astype(str).str.strip()
 
         commitments = []
-        for _, row in df.iterrows():
+        for row in df.itertuples(index=False):
+            zone = getattr(row, "zone", None)
             commitment = ServiceCommitment(
-                origin=str(row["origin"]).strip(),
-                dest=str(row["dest"]).strip(),
-                zone=int(row["zone"]) if pd.notna(row.get("zone")) else None,
-                sla_days=int(row["sla_days"]),
-                sla_buffer_days=float(row.get("sla_buffer_days", 0)),
-                priority_weight=float(row.get("priority_weight", 1.0))
+                origin=sys.intern(row.origin),
+                dest=sys.intern(row.dest),
+                zone=int(zone) if pd.notna(zone) else None,
+                sla_days=int(row.sla_days),
+                sla_buffer_days=float(getattr(row, "sla_buffer_days", 0)),
+                priority_weight=float(getattr(row, "priority_weight", 1.0))
             )
             commitments.append(commitment)
 
@@ -380,13 +432,9 @@ class InputLoader:
         return commitments
 
     def load_run_settings(self) -> RunSettings:
-        df = pd.read_excel(self.excel, sheet_name="run_settings")
+        df = self._read_sheet("run_settings")
 
-        settings = {}
-        for _, row in df.iterrows():
-            key = str(row["key"]).strip()
-            value = row["value"]
-            settings[key] = value
+        settings = dict(zip(df["key"].astype(str).str.strip(), df["value"]))
 
         # Validate required settings
         required_keys = [
@@ -443,6 +491,7 @@ class InputLoader:
         return run_settings
 
     def load_all(self) -> dict:
+        self._read_all_sheets()
         facilities = self.load_facilities()
 
         return {
@@ -457,4 +506,38 @@ class InputLoader:
             "service_commitments": self.load_service_commitments(),
             "run_settings": self.load_run_settings(),
             "market_demand": self.load_market_demand(),  # NEW - optional commercial forecast
-        }
\ No newline at end of file
+        }
+
+
+def load_all_cached(filepath: str, cache_dir: str) -> dict:
+    """
+    InputLoader(filepath).load_all(), memoized on disk.
+
+    The cache file name carries the SHA-1 of the workbook bytes and the package
+    version, so editing the input or upgrading the model forces a fresh parse.
+    Unreadable cache files are ignored and rewritten.
+    """
+    path = Path(filepath)
+    if not path.exists():
+        raise FileNotFoundError(f"Input file not found: {filepath}")
+
+    digest = hashlib.sha1(path.read_bytes()).hexdigest()[:16]
+    cache_path = Path(cache_dir) / f"{path.stem}_{digest}_v{__version__}.pkl"
+
+    if cache_path.exists():
+        try:
+            with open(cache_path, "rb") as f:
+                data = pickle.load(f)
+            logger.info(f"Loaded inputs from cache: {cache_path}")
+            return data
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable input cache {cache_path}: {e}")
+
+    data = InputLoader(filepath).load_all()
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, "wb") as f:
+        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+    logger.info(f"Cached parsed inputs to {cache_path}")
+
+    return data
@@ -1,9 +1,12 @@
 """Generate all candidate paths through the network."""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
 from .config import (
     Facility, FacilityType, PathCandidate, PathType, SortLevel, RunSettings,
     ALL_SORT_LEVELS
 )
-from .geo import haversine_miles, calculate_atw_factor, calculate_path_distance
+from .geo import DistanceCache, calculate_atw_factor
 from .utils import setup_logging
 
 logger = setup_logging()
@@ -17,6 +20,11 @@ class PathEnumerator:
         self.max_path_touches = run_settings.max_path_touches
         self.max_atw_factor = run_settings.max_path_atw_factor
         self.enabled_sort_levels = enabled_sort_levels if enabled_sort_levels is not None else ALL_SORT_LEVELS
+        # Enum members hash in Python, so resolve the frozenset membership once per run
+        self._sort_group_enabled = SortLevel.SORT_GROUP in self.enabled_sort_levels
+        self._market_enabled = SortLevel.MARKET in self.enabled_sort_levels
+        self._region_enabled = SortLevel.REGION in self.enabled_sort_levels
+        self.distances = DistanceCache(facilities)
 
         self._build_injection_facilities(injection_df)
         self._build_facility_lookups()
@@ -52,6 +60,10 @@ class PathEnumerator:
 
         self.sorting_facilities = {**self.hubs, **self.hybrids}
 
+        # Name sets for the structure rules: valid origins/intermediates and valid destinations
+        self._sorting_set = frozenset(self.sorting_facilities)
+        self._delivery_set = frozenset({**self.launches, **self.hybrids})
+
         # Build regional_sort_hub mappings
         self.regional_hub = {}
         self.regional_hub_to_facilities = {}  # Reverse mapping: RSH -> list of facilities it serves
@@ -63,6 +75,13 @@ class PathEnumerator:
                     self.regional_hub_to_facilities[fac.regional_sort_hub] = []
                 self.regional_hub_to_facilities[fac.regional_sort_hub].append(name)
 
+        # Sorting facilities served by each RSH, in sorting_facilities order (see _next_intermediates)
+        self._sorting_children: dict[str, list[str]] = {}
+        for name in self.sorting_facilities:
+            rsh = self.regional_hub.get(name)
+            if rsh is not None:
+                self._sorting_children.setdefault(rsh, []).append(name)
+
         logger.info(
             f"Path enumeration: {len(self.hubs)} hubs, {len(self.hybrids)} hybrids, "
             f"{len(self.launches)} launches, {len(self.regional_hub_to_facilities)} regional sort hubs"
@@ -74,36 +93,25 @@ class PathEnumerator:
         if dest not in self.facilities:
             raise ValueError(f"Unknown destination facility: {dest}")
 
-        origin_fac = self.facilities[origin]
-        dest_fac = self.facilities[dest]
-
-        direct_miles = haversine_miles(
-            origin_fac.lat, origin_fac.lon,
-            dest_fac.lat, dest_fac.lon
-        )
+        direct_miles = self.distances.miles(origin, dest)
 
         # O=D: Return single hardcoded path, no enumeration needed
         if origin == dest:
             return self._create_od_equal_path(origin, dest)
 
-        raw_paths = self._enumerate_raw_paths(origin, dest)
+        raw_paths = self._enumerate_raw_paths(origin, dest, direct_miles)
 
-        candidates = []
+        # ATW filter is applied per raw path inside _expand_path_to_candidates
+        valid_candidates = []
         for path_nodes in raw_paths:
             path_candidates = self._expand_path_to_candidates(
                 path_nodes, origin, dest, direct_miles
             )
-            candidates.extend(path_candidates)
-
-        # Filter by ATW factor
-        valid_candidates = [
-            c for c in candidates
-            if c.atw_factor <= self.max_atw_factor
-        ]
+            valid_candidates.extend(path_candidates)
 
         logger.debug(
             f"OD {origin}->{dest}: {len(raw_paths)} raw paths, "
-            f"{len(candidates)} candidates, {len(valid_candidates)} after ATW filter"
+            f"{len(valid_candidates)} candidates after ATW filter"
         )
 
         return valid_candidates
@@ -130,7 +138,7 @@ class PathEnumerator:
             atw_factor=1.0
         )]
 
-    def _enumerate_raw_paths(self, origin: str, dest: str) -> list[list[str]]:
+    def _enumerate_raw_paths(self, origin: str, dest: str, direct_miles: float) -> list[list[str]]:
         """
         Enumerate raw paths based on max_path_touches.
 
@@ -139,50 +147,122 @@ class PathEnumerator:
         - 3-touch: O -> H -> D (3 nodes)
         - 4-touch: O -> H1 -> H2 -> D (4 nodes)
         - 5-touch: O -> H1 -> H2 -> H3 -> D (5 nodes)
+
+        Prefixes whose miles so far already exceed the ATW limit are pruned
+        before their extensions are generated or structure-checked. Leg miles
+        are non-negative, so the full path would fail the same ATW check in
+        _expand_path_to_candidates; the surviving paths are unchanged.
+        Likewise, a non-injection hub is only extended to its own children
+        (rule 4, see _next_intermediates), and when the destination's RSH must
+        be on the path (rule 5) the last hop is restricted to it unless an
+        earlier hop already passed through it. Working back from the
+        destination, the final intermediate must be one that can hand off to
+        it under rule 4: an injection facility or the destination's RSH.
         """
         paths = []
+        miles = self.distances.miles
+
+        def over_atw(prefix_miles: float) -> bool:
+            return not calculate_atw_factor(prefix_miles, direct_miles) <= self.max_atw_factor
 
         # 2-touch: Direct path (always valid if max_path_touches >= 2)
         if self.max_path_touches >= 2:
             paths.append([origin, dest])
 
+        # Rules 1, 2 and 5 depend only on the endpoints, so they are resolved once per OD
+        if not self._is_valid_endpoint_pair(origin, dest):
+            return paths
+        required_hub = self._required_regional_hub(origin, dest)
+        if required_hub is not None and required_hub not in self._sorting_set:
+            # The RSH cannot be an intermediate, so no multi-hop path can satisfy rule 5
+            return paths
+
+        # Rule 4 seen from the destination: which intermediates may hand off to it
+        dest_rsh = self.regional_hub.get(dest)
+        injection = self.injection_facilities
+
+        # Every multi-hop path routes through sorting facilities other than the endpoints
+        intermediates = [name for name in self.sorting_facilities if name != origin and name != dest]
+
         # 3-touch: O -> H -> D
         if self.max_path_touches >= 3:
-            for hub_name in self.sorting_facilities:
-                if hub_name != origin and hub_name != dest:
-                    path = [origin, hub_name, dest]
-                    if self._is_valid_path_structure(path):
-                        paths.append(path)
+            for hub_name in self._last_intermediates(intermediates, required_hub):
+                if hub_name not in injection and hub_name != dest_rsh:
+                    continue
+                if over_atw(miles(origin, hub_name)):
+                    continue
+                path = [origin, hub_name, dest]
+                if self._is_valid_hops(path, required_hub):
+                    paths.append(path)
 
         # 4-touch: O -> H1 -> H2 -> D
         if self.max_path_touches >= 4:
-            for hub1 in self.sorting_facilities:
-                if hub1 == origin or hub1 == dest:
+            for hub1 in intermediates:
+                miles1 = miles(origin, hub1)
+                if over_atw(miles1):
                     continue
-                for hub2 in self.sorting_facilities:
-                    if hub2 == origin or hub2 == dest or hub2 == hub1:
+                hub2_options = self._next_intermediates(hub1, intermediates, origin, dest)
+                if hub1 != required_hub:
+                    hub2_options = self._last_intermediates(hub2_options, required_hub)
+                for hub2 in hub2_options:
+                    if hub2 == hub1 or (hub2 not in injection and hub2 != dest_rsh):
+                        continue
+                    if over_atw(miles1 + miles(hub1, hub2)):
                         continue
                     path = [origin, hub1, hub2, dest]
-                    if self._is_valid_path_structure(path):
+                    if self._is_valid_hops(path, required_hub):
                         paths.append(path)
 
         # 5-touch: O -> H1 -> H2 -> H3 -> D
         if self.max_path_touches >= 5:
-            for hub1 in self.sorting_facilities:
-                if hub1 == origin or hub1 == dest:
+            for hub1 in intermediates:
+                miles1 = miles(origin, hub1)
+                if over_atw(miles1):
                     continue
-                for hub2 in self.sorting_facilities:
-                    if hub2 == origin or hub2 == dest or hub2 == hub1:
+                for hub2 in self._next_intermediates(hub1, intermediates, origin, dest):
+                    if hub2 == hub1:
                         continue
-                    for hub3 in self.sorting_facilities:
-                        if hub3 == origin or hub3 == dest or hub3 == hub1 or hub3 == hub2:
+                    miles2 = miles1 + miles(hub1, hub2)
+                    if over_atw(miles2):
+                        continue
+                    hub3_options = self._next_intermediates(hub2, intermediates, origin, dest)
+                    if hub1 != required_hub and hub2 != required_hub:
+                        hub3_options = self._last_intermediates(hub3_options, required_hub)
+                    for hub3 in hub3_options:
+                        if hub3 == hub1 or hub3 == hub2 or (hub3 not in injection and hub3 != dest_rsh):
+                            continue
+                        if over_atw(miles2 + miles(hub2, hub3)):
                             continue
                         path = [origin, hub1, hub2, hub3, dest]
-                        if self._is_valid_path_structure(path):
+                        if self._is_valid_hops(path, required_hub):
                             paths.append(path)
 
         return paths
 
+    def _next_intermediates(
+            self,
+            hub: str,
+            intermediates: list[str],
+            origin: str,
+            dest: str
+    ) -> list[str]:
+        """
+        Intermediates that may follow hub on a path (rule 4).
+
+        Injection facilities can route to any sorting facility; any other hub
+        only to the sorting facilities it is regional sort hub for.
+        """
+        if hub in self.injection_facilities:
+            return intermediates
+        return [name for name in self._sorting_children.get(hub, ()) if name != origin and name != dest]
+
+    @staticmethod
+    def _last_intermediates(options: list[str], required_hub: Optional[str]) -> list[str]:
+        """Options for the final intermediate of a path that has not yet passed required_hub (rule 5)."""
+        if required_hub is None:
+            return options
+        return [name for name in options if name == required_hub]
+
     def _is_valid_path_structure(self, path: list[str]) -> bool:
         """
         Validate path structure with hierarchy enforcement.
@@ -193,6 +273,10 @@ class PathEnumerator:
         3. All intermediates must be hub or hybrid
         4. Non-injection intermediates can only route to their children (via regional_sort_hub)
         5. If destination has regional_sort_hub (other than itself), RSH must be in path
+
+        _enumerate_raw_paths applies the same rules piecewise: endpoints once
+        per OD, intermediates are drawn from sorting facilities only, and
+        _is_valid_hops covers rules 4-5 per path.
         """
         if len(path) < 2:
             return False
@@ -200,49 +284,46 @@ class PathEnumerator:
         origin = path[0]
         dest = path[-1]
 
-        # Rule 1: Origin must be hub or hybrid
-        origin_fac = self.facilities[origin]
-        if origin_fac.facility_type not in (FacilityType.HUB, FacilityType.HYBRID):
+        if not self._is_valid_endpoint_pair(origin, dest):
             return False
 
-        # Rule 2: Destination must be launch or hybrid
-        dest_fac = self.facilities[dest]
-        if dest_fac.facility_type not in (FacilityType.LAUNCH, FacilityType.HYBRID):
-            return False
-
-        # Rule 3 & 4: Validate intermediates with hierarchy enforcement
-        for i in range(1, len(path) - 1):
-            node = path[i]
-            node_fac = self.facilities[node]
-
-            # All intermediates must be hub or hybrid
-            if node_fac.facility_type not in (FacilityType.HUB, FacilityType.HYBRID):
+        # Rule 3: All intermediates must be hub or hybrid
+        for node in path[1:-1]:
+            if node not in self._sorting_set:
                 return False
 
-            # HIERARCHY ENFORCEMENT: Non-injection intermediates can only route to children
-            if node not in self.injection_facilities:
-                next_node = path[i + 1]
-                next_fac = self.facilities[next_node]
+        return self._is_valid_hops(path, self._required_regional_hub(origin, dest))
 
-                # Check if next_node is a child of current node (via regional_sort_hub)
-                is_child = (next_fac.regional_sort_hub == node)
+    def _is_valid_endpoint_pair(self, origin: str, dest: str) -> bool:
+        """Rules 1-2: origin must be hub or hybrid, destination must be launch or hybrid."""
+        return origin in self._sorting_set and dest in self._delivery_set
 
-                if not is_child:
-                    # Non-injection intermediate routing to non-child: invalid path
-                    return False
+    def _required_regional_hub(self, origin: str, dest: str) -> Optional[str]:
+        """
+        Rule 5: the destination's regional sort hub, if a path must pass through it.
 
-        # Rule 5: If destination has regional_sort_hub (not self-referencing), RSH must be in path
-        # This ensures proper last mile hierarchy
-        if dest in self.regional_hub:
-            rsh = self.regional_hub[dest]
-            # Only enforce if RSH is not the destination itself
-            if rsh != dest:
-                # Check if origin is the RSH or if RSH appears in path
-                origin_rsh = self.regional_hub.get(origin)
+        None when the destination has no RSH (or is its own RSH), or when the
+        origin is that RSH or is served by it.
+        """
+        rsh = self.regional_hub.get(dest)
+        if rsh is None or rsh == dest:
+            return None
+        if origin == rsh or self.regional_hub.get(origin) == rsh:
+            return None
+        return rsh
+
+    def _is_valid_hops(self, path: list[str], required_hub: Optional[str]) -> bool:
+        """Rules 4-5 for a path whose endpoints and intermediates are already valid."""
+        # HIERARCHY ENFORCEMENT: Non-injection intermediates can only route to
+        # their children (next node's regional_sort_hub is the intermediate)
+        for i in range(1, len(path) - 1):
+            node = path[i]
+            if node not in self.injection_facilities and self.regional_hub.get(path[i + 1]) != node:
+                return False
 
-                if origin != rsh and origin_rsh != rsh:
-                    if rsh not in path:
-                        return False
+        # Rule 5: the destination's RSH must be in the path
+        if required_hub is not None and required_hub not in path:
+            return False
 
         return True
 
@@ -253,9 +334,14 @@ class PathEnumerator:
             dest: str,
             direct_miles: float
     ) -> list[PathCandidate]:
-        total_miles, leg_miles = calculate_path_distance(path_nodes, self.facilities)
+        total_miles, leg_miles = self.distances.path_distance(path_nodes)
         atw_factor = calculate_atw_factor(total_miles, direct_miles)
 
+        # All sort-level variants share the path's ATW factor, so a path over the
+        # limit is dropped before any PathCandidate objects are allocated for it
+        if not atw_factor <= self.max_atw_factor:
+            return []
+
         num_touches = len(path_nodes)
         path_type = {
             2: PathType.TWO_TOUCH,
@@ -272,7 +358,7 @@ class PathEnumerator:
 
         # SORT_GROUP: Valid for any path
         # dest_sort_level = SORT_GROUP (no LM sort needed)
-        if SortLevel.SORT_GROUP in self.enabled_sort_levels:
+        if self._sort_group_enabled:
             candidates.append(PathCandidate(
                 origin=origin,
                 dest=dest,
@@ -287,7 +373,7 @@ class PathEnumerator:
 
         # MARKET: Valid for any path
         # dest_sort_level = MARKET (LM sort needed)
-        if SortLevel.MARKET in self.enabled_sort_levels:
+        if self._market_enabled:
             candidates.append(PathCandidate(
                 origin=origin,
                 dest=dest,
@@ -303,7 +389,7 @@ class PathEnumerator:
         # REGION: Valid when 2nd-to-last facility is destination's RSH,
         # OR when destination itself IS an RSH
         # NOT valid for direct paths from RSH to child (that's just MARKET/SORT_GROUP)
-        if SortLevel.REGION in self.enabled_sort_levels:
+        if self._region_enabled:
 
             # Case 1: Multi-hop path where 2nd-to-last IS the destination's RSH
             # Example: ATL02 → PHL01 → ABE01 (where ABE01.regional_sort_hub = PHL01)
@@ -324,7 +410,7 @@ class PathEnumerator:
                 ))
                 # 1b. RSH sorts to sort_group level, destination only does route sort (minimal LM sort)
                 # Only create this variant if SORT_GROUP is also enabled
-                if SortLevel.SORT_GROUP in self.enabled_sort_levels:
+                if self._sort_group_enabled:
                     candidates.append(PathCandidate(
                         origin=origin,
                         dest=dest,
@@ -408,11 +494,33 @@ class PathEnumerator:
         return candidates
 
 
+def _enumerate_od_chunk(
+        facilities: dict[str, Facility],
+        run_settings: RunSettings,
+        injection_df,
+        enabled_sort_levels: frozenset,
+        od_pairs: list[tuple[str, str]]
+) -> dict[tuple[str, str], list[PathCandidate]]:
+    """Worker entry point: enumerate paths for a chunk of OD pairs in a child process."""
+    enumerator = PathEnumerator(facilities, run_settings, injection_df, enabled_sort_levels)
+    return {
+        (origin, dest): enumerator.enumerate_paths_for_od(origin, dest)
+        for origin, dest in od_pairs
+    }
+
+
 def enumerate_all_paths(
         data: dict,
         od_demands: list,
-        enabled_sort_levels: frozenset = None
+        enabled_sort_levels: frozenset = None,
+        workers: int = 1
 ) -> dict[tuple[str, str], list[PathCandidate]]:
+    """
+    Enumerate candidate paths for every OD pair with demand.
+
+    OD pairs are independent, so with workers > 1 the networked pairs are
+    split round-robin across a process pool.
+    """
     enumerator = PathEnumerator(
         facilities=data["facilities"],
         run_settings=data["run_settings"],
@@ -435,9 +543,24 @@ def enumerate_all_paths(
     od_paths = {}
 
     # Enumerate networked paths (zone 1+)
-    for origin, dest in networked_od_pairs:
-        candidates = enumerator.enumerate_paths_for_od(origin, dest)
-        od_paths[(origin, dest)] = candidates
+    if workers > 1 and len(networked_od_pairs) > 1:
+        od_pairs = list(networked_od_pairs)
+        chunks = [od_pairs[i::workers] for i in range(workers)]
+        n = len(chunks)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk_paths in pool.map(
+                    _enumerate_od_chunk,
+                    [enumerator.facilities] * n,
+                    [data["run_settings"]] * n,
+                    [data["injection_distribution"]] * n,
+                    [enumerator.enabled_sort_levels] * n,
+                    chunks
+            ):
+                od_paths.update(chunk_paths)
+    else:
+        for origin, dest in networked_od_pairs:
+            candidates = enumerator.enumerate_paths_for_od(origin, dest)
+            od_paths[(origin, dest)] = candidates
 
     # Create DI paths (zone 0, always O=D)
     for origin, dest in di_od_pairs:
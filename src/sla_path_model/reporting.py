@@ -1,4 +1,5 @@
 """Report generation for SLA path model outputs."""
+import heapq
 from collections import defaultdict
 
 import pandas as pd
@@ -8,6 +9,17 @@ from .utils import setup_logging
 
 logger = setup_logging()
 
+# feasible_paths column order; rows are built as tuples in this order
+FEASIBLE_PATHS_COLUMNS = (
+    "scenario_id", "origin", "dest",
+    "node_1", "node_2", "node_3", "node_4", "node_5",
+    "path_type", "sort_level", "dest_sort_level",
+    "total_path_miles", "direct_miles", "atw_factor",
+    "tnt_hours", "tnt_sort_hours", "tnt_crossdock_hours", "tnt_transit_hours", "tnt_dwell_hours",
+    "sla_days", "sla_target_hours", "sla_met", "sla_slack_hours", "uses_only_active_arcs",
+    "pkgs_day", "pkgs_mm", "pkgs_zs", "pkgs_di", "zone",
+)
+
 
 def _path_ranking_key(timing: PathTimingResult) -> tuple:
     """
@@ -50,9 +62,8 @@ def filter_top_paths_per_sort_level(
         # Keep top N per sort_level
         kept = []
         for sort_level, level_timings in by_sort_level.items():
-            # Sort by ranking key and take top N
-            level_timings.sort(key=_path_ranking_key)
-            kept.extend(level_timings[:top_n])
+            # Top N by ranking key, in ranked order (same as a stable sort + slice)
+            kept.extend(heapq.nsmallest(top_n, level_timings, key=_path_ranking_key))
 
         filtered[(origin, dest)] = kept
         total_after += len(kept)
@@ -77,6 +88,11 @@ class ReportBuilder:
         self.od_timings = od_timings
         self.scenario_sort_levels = scenario_sort_levels or {}
 
+        # Demands grouped by scenario once, in first-seen order, for the per-scenario reports
+        self._demands_by_scenario: dict[str, list[ODDemand]] = defaultdict(list)
+        for demand in od_demands:
+            self._demands_by_scenario[demand.scenario_id].append(demand)
+
     def _filter_timings_for_scenario(
             self,
             timings: list[PathTimingResult],
@@ -90,6 +106,8 @@ class ReportBuilder:
         if enabled is None or enabled == ALL_SORT_LEVELS:
             return timings
 
+        # Tuple membership hits the identity check before any (Python-level) enum hashing
+        enabled = tuple(enabled)
         return [
             t for t in timings
             if t.path.path_type in (PathType.DIRECT_INJECTION, PathType.OD_MM)
@@ -199,10 +217,7 @@ class ReportBuilder:
         """
         rows = []
 
-        scenarios = set(d.scenario_id for d in self.od_demands)
-
-        for scenario_id in scenarios:
-            scenario_demands = [d for d in self.od_demands if d.scenario_id == scenario_id]
+        for scenario_id, scenario_demands in self._demands_by_scenario.items():
 
             # Aggregate demand by (origin, dest, flow_type)
             demand_by_od = defaultdict(lambda: {
@@ -287,49 +302,46 @@ class ReportBuilder:
                         elif step.step_type == StepType.TRANSIT:
                             tnt_transit_mins += step.duration_minutes
 
-                    rows.append({
-                        "scenario_id": scenario_id,
-                        "origin": timing.path.origin,
-                        "dest": timing.path.dest,
-                        "node_1": nodes[0] if len(nodes) > 0 else None,
-                        "node_2": nodes[1] if len(nodes) > 1 else None,
-                        "node_3": nodes[2] if len(nodes) > 2 else None,
-                        "node_4": nodes[3] if len(nodes) > 3 else None,
-                        "node_5": nodes[4] if len(nodes) > 4 else None,
-                        "path_type": path_type.value,
-                        "sort_level": timing.path.sort_level.value,
-                        "dest_sort_level": timing.path.dest_sort_level.value,
-                        "total_path_miles": round(timing.path.total_path_miles, 1),
-                        "direct_miles": round(timing.path.direct_miles, 1),
-                        "atw_factor": round(timing.path.atw_factor, 3),
-                        "tnt_hours": round(timing.tnt_hours, 2),
-                        "tnt_sort_hours": round(tnt_sort_mins / 60, 2),
-                        "tnt_crossdock_hours": round(tnt_crossdock_mins / 60, 2),
-                        "tnt_transit_hours": round(tnt_transit_mins / 60, 2),
-                        "tnt_dwell_hours": round(timing.total_dwell_hours, 2),
-                        "sla_days": timing.sla_days,
-                        "sla_target_hours": round(timing.sla_target_hours, 2),
-                        "sla_met": timing.sla_met,
-                        "sla_slack_hours": round(timing.sla_slack_hours, 2),
-                        "uses_only_active_arcs": timing.uses_only_active_arcs,
-                        "pkgs_day": path_pkgs_day,
-                        "pkgs_mm": path_pkgs_mm,
-                        "pkgs_zs": path_pkgs_zs,
-                        "pkgs_di": path_pkgs_di,
-                        "zone": path_zone
-                    })
-
-        df = pd.DataFrame(rows)
+                    rows.append((
+                        scenario_id,
+                        timing.path.origin,
+                        timing.path.dest,
+                        nodes[0] if len(nodes) > 0 else None,
+                        nodes[1] if len(nodes) > 1 else None,
+                        nodes[2] if len(nodes) > 2 else None,
+                        nodes[3] if len(nodes) > 3 else None,
+                        nodes[4] if len(nodes) > 4 else None,
+                        path_type.value,
+                        timing.path.sort_level.value,
+                        timing.path.dest_sort_level.value,
+                        round(timing.path.total_path_miles, 1),
+                        round(timing.path.direct_miles, 1),
+                        round(timing.path.atw_factor, 3),
+                        round(timing.tnt_hours, 2),
+                        round(tnt_sort_mins / 60, 2),
+                        round(tnt_crossdock_mins / 60, 2),
+                        round(tnt_transit_mins / 60, 2),
+                        round(timing.total_dwell_hours, 2),
+                        timing.sla_days,
+                        round(timing.sla_target_hours, 2),
+                        timing.sla_met,
+                        round(timing.sla_slack_hours, 2),
+                        timing.uses_only_active_arcs,
+                        path_pkgs_day,
+                        path_pkgs_mm,
+                        path_pkgs_zs,
+                        path_pkgs_di,
+                        path_zone,
+                    ))
+
+        df = pd.DataFrame.from_records(rows, columns=FEASIBLE_PATHS_COLUMNS)
         logger.info(f"Built feasible_paths with {len(df)} rows")
         return df
 
     def build_summary_df(self) -> pd.DataFrame:
         rows = []
 
-        scenarios = set(d.scenario_id for d in self.od_demands)
-
-        for scenario_id in scenarios:
-            scenario_demands = [d for d in self.od_demands if d.scenario_id == scenario_id]
+        for scenario_id, scenario_demands in self._demands_by_scenario.items():
 
             total_od_pairs = len(scenario_demands)
             total_packages = sum(d.pkgs_day for d in scenario_demands)
@@ -383,10 +395,7 @@ class ReportBuilder:
     def build_sla_miss_detail_df(self) -> pd.DataFrame:
         rows = []
 
-        scenarios = set(d.scenario_id for d in self.od_demands)
-
-        for scenario_id in scenarios:
-            scenario_demands = [d for d in self.od_demands if d.scenario_id == scenario_id]
+        for scenario_id, scenario_demands in self._demands_by_scenario.items():
 
             for demand in scenario_demands:
                 key = (demand.origin, demand.dest)
@@ -1,6 +1,6 @@
 """Time utilities: timezone conversion, window alignment, dwell calculation."""
-from datetime import datetime, time, timedelta
-from typing import Optional
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 from .config import SortWindow, MINUTES_PER_DAY
@@ -15,7 +15,25 @@ def local_to_utc(local_dt: datetime, tz: ZoneInfo) -> datetime:
     return local_aware.astimezone(UTC).replace(tzinfo=None)
 
 
+@lru_cache(maxsize=None)
+def local_time_to_utc(local_date: date, local_time: time, tz: ZoneInfo) -> datetime:
+    """
+    Convert a wall-clock time on a local date to naive UTC.
+
+    Cached because CPT and window times repeat across every path that uses
+    a facility, so the same (date, time, tz) keys are converted many times.
+    """
+    return local_to_utc(datetime.combine(local_date, local_time), tz)
+
+
+@lru_cache(maxsize=None)
 def utc_to_local(utc_dt: datetime, tz: ZoneInfo) -> datetime:
+    """
+    Convert naive UTC to naive local wall-clock time.
+
+    Cached because forward chaining from the single reference injection time
+    revisits the same few thousand instants across all paths.
+    """
     utc_aware = utc_dt.replace(tzinfo=UTC)
     return utc_aware.astimezone(tz).replace(tzinfo=None)
 
@@ -31,8 +49,8 @@ def minutes_to_time(mins: int) -> time:
 
 def is_time_in_window(check_time: time, window: SortWindow) -> bool:
     check_mins = time_to_minutes(check_time)
-    start_mins = time_to_minutes(window.start_local)
-    end_mins = time_to_minutes(window.end_local)
+    start_mins = window.start_min
+    end_mins = window.end_min
 
     if window.crosses_midnight():
         return check_mins >= start_mins or check_mins < end_mins
@@ -73,13 +91,9 @@ def align_to_window_end(
     if is_time_in_window(proposed_start_time, window):
         return local_to_utc(proposed_start_local, window.timezone), 0.0
 
-    window_end_mins = time_to_minutes(window.end_local)
-    window_start_mins = time_to_minutes(window.start_local)
-
-    if window.crosses_midnight():
-        window_duration = (MINUTES_PER_DAY - window_start_mins) + window_end_mins
-    else:
-        window_duration = window_end_mins - window_start_mins
+    window_end_mins = window.end_min
+    window_start_mins = window.start_min
+    window_duration = window.duration_minutes()
 
     if processing_minutes > window_duration:
         processing_minutes = window_duration
@@ -133,8 +147,8 @@ def align_to_window_start(
     ready_time = ready_local.time()
     ready_mins = time_to_minutes(ready_time)
 
-    window_start_mins = time_to_minutes(window.start_local)
-    window_end_mins = time_to_minutes(window.end_local)
+    window_start_mins = window.start_min
+    window_end_mins = window.end_min
 
     # Check if ready time is within window
     if is_time_in_window(ready_time, window):
@@ -148,23 +162,20 @@ def align_to_window_start(
         if ready_mins < window_start_mins and ready_mins >= window_end_mins:
             # We're in the gap (e.g., 10:00 when window is 22:00-06:00)
             # Next window start is today at window_start_mins
-            next_start_local = datetime.combine(ready_date, window.start_local)
+            next_start_date = ready_date
         else:
             # Shouldn't reach here if is_time_in_window is correct
-            next_start_local = datetime.combine(ready_date, window.start_local)
+            next_start_date = ready_date
     else:
         # Window like 06:00 - 22:00
         if ready_mins < window_start_mins:
             # Before window opens today
-            next_start_local = datetime.combine(ready_date, window.start_local)
+            next_start_date = ready_date
         else:
             # After window closed, next opening is tomorrow
-            next_start_local = datetime.combine(
-                ready_date + timedelta(days=1),
-                window.start_local
-            )
+            next_start_date = ready_date + timedelta(days=1)
 
-    next_start_utc = local_to_utc(next_start_local, window.timezone)
+    next_start_utc = local_time_to_utc(next_start_date, window.start_local, window.timezone)
     dwell_minutes = (next_start_utc - ready_utc).total_seconds() / 60
 
     return next_start_utc, max(0.0, dwell_minutes)
\ No newline at end of file
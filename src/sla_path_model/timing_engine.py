@@ -13,7 +13,9 @@ Algorithm:
 3. Result: arrival time and total TNT from fixed injection
 4. sla_slack_hours = SLA target - TNT (positive = meets SLA, negative = misses)
 """
-from datetime import datetime, timedelta, time
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta, time
 from typing import Optional
 
 from .config import (
@@ -21,9 +23,9 @@ from .config import (
     SortLevel, StepType, TimingParams, MileageBand, CPT, PathType,
     MINUTES_PER_HOUR
 )
-from .cpt_generator import CPTGenerator, get_cpts_for_path
-from .geo import haversine_miles, get_zone_for_distance, calculate_transit_time_minutes
-from .time_utils import local_to_utc, utc_to_local, align_to_window_start
+from .cpt_generator import CPTGenerator
+from .geo import DistanceCache, get_zone_for_distance, calculate_transit_time_minutes
+from .time_utils import local_to_utc, local_time_to_utc, utc_to_local, align_to_window_start
 from .utils import setup_logging
 
 logger = setup_logging()
@@ -46,6 +48,12 @@ class TimingEngine:
         self.cpt_generator = cpt_generator
         self.reference_date = reference_date
         self.reference_injection_time = reference_injection_time or time(18, 0)
+        # Injection date is fixed for the run; UTC injection per origin timezone is cached
+        self._reference_local_date = reference_date.date()
+
+        self.distances = DistanceCache(facilities)
+        self._arc_transit: dict[tuple[str, str], tuple[float, float]] = {}
+        self._cpt_departures: dict[tuple[str, str, date], list[tuple[datetime, int, bool]]] = {}
 
     def calculate_path_timing(self, path: PathCandidate) -> PathTimingResult:
         """
@@ -62,11 +70,11 @@ class TimingEngine:
         origin_fac = self.facilities[path.origin]
 
         # Fixed injection time in origin's local timezone, converted to UTC
-        injection_local = datetime.combine(
-            self.reference_date.date(),
-            self.reference_injection_time
+        injection_utc = local_time_to_utc(
+            self._reference_local_date,
+            self.reference_injection_time,
+            origin_fac.timezone
         )
-        injection_utc = local_to_utc(injection_local, origin_fac.timezone)
 
         steps = []
         current_time_utc = injection_utc
@@ -147,15 +155,7 @@ class TimingEngine:
                     all_arcs_active = False
 
                 # Calculate transit
-                distance = haversine_miles(from_fac.lat, from_fac.lon, to_fac.lat, to_fac.lon)
-                band = get_zone_for_distance(distance, self.mileage_bands)
-
-                if band:
-                    transit_minutes = calculate_transit_time_minutes(
-                        distance, band.circuity_factor, band.mph
-                    )
-                else:
-                    transit_minutes = distance / 50 * MINUTES_PER_HOUR
+                distance, transit_minutes = self._get_arc_transit(from_node, to_node)
 
                 arrival_utc = cpt_departure_utc + timedelta(minutes=transit_minutes)
 
@@ -325,10 +325,56 @@ class TimingEngine:
             uses_only_active_arcs=all_arcs_active
         )
 
+    def _get_arc_transit(self, from_node: str, to_node: str) -> tuple[float, float]:
+        """Return (distance_miles, transit_minutes) for an arc, computed once per arc."""
+        key = (from_node, to_node)
+        cached = self._arc_transit.get(key)
+        if cached is not None:
+            return cached
+
+        distance = self.distances.miles(from_node, to_node)
+        band = get_zone_for_distance(distance, self.mileage_bands)
+
+        if band:
+            transit_minutes = calculate_transit_time_minutes(
+                distance, band.circuity_factor, band.mph
+            )
+        else:
+            transit_minutes = distance / 50 * MINUTES_PER_HOUR
+
+        self._arc_transit[key] = (distance, transit_minutes)
+        return distance, transit_minutes
+
+    def _get_cpt_departures(
+            self,
+            origin: str,
+            dest: str,
+            cpts: tuple[CPT, ...],
+            search_date: date
+    ) -> list[tuple[datetime, int, bool]]:
+        """
+        Sorted (departure_utc, cpt_index, is_active) for every CPT of an arc on
+        the search date and the 4 days after it, computed once per (arc, date).
+
+        Each CPT's departures increase day by day, so the first entry at or after
+        a ready time is the earliest CPT; cpt_index keeps first-listed-wins ties.
+        """
+        key = (origin, dest, search_date)
+        departures = self._cpt_departures.get(key)
+        if departures is None:
+            departures = sorted(
+                (local_time_to_utc(search_date + timedelta(days=day_offset), cpt.cpt_local, cpt.timezone),
+                 cpt_index, cpt.is_active)
+                for cpt_index, cpt in enumerate(cpts)
+                for day_offset in range(5)
+            )
+            self._cpt_departures[key] = departures
+        return departures
+
     def _find_next_cpt(
             self,
             ready_utc: datetime,
-            cpts: list[CPT],
+            cpts: tuple[CPT, ...],
             origin_fac: Facility,
             origin: str,
             dest: str
@@ -343,20 +389,13 @@ class TimingEngine:
         ready_local = utc_to_local(ready_utc, origin_fac.timezone)
         search_date = ready_local.date()
 
-        # Build list of (cpt_utc, is_active) tuples
-        cpt_candidates = []
-        for cpt in cpts:
-            for day_offset in [0, 1, 2, 3, 4]:
-                cpt_date = search_date + timedelta(days=day_offset)
-                cpt_local = datetime.combine(cpt_date, cpt.cpt_local)
-                cpt_utc = local_to_utc(cpt_local, cpt.timezone)
-                if cpt_utc >= ready_utc:
-                    cpt_candidates.append((cpt_utc, cpt.is_active))
-
-        if cpt_candidates:
-            # Sort by time and take earliest
-            cpt_candidates.sort(key=lambda x: x[0])
-            next_cpt_utc, is_active = cpt_candidates[0]
+        # Earliest departure at or after ready_utc via binary search over the
+        # arc's sorted departures for this search date
+        departures = self._get_cpt_departures(origin, dest, cpts, search_date)
+        idx = bisect_left(departures, (ready_utc,))
+
+        if idx < len(departures):
+            next_cpt_utc, _, is_active = departures[idx]
             dwell_minutes = (next_cpt_utc - ready_utc).total_seconds() / 60
             return next_cpt_utc, max(0, dwell_minutes), is_active
 
@@ -441,10 +480,42 @@ class TimingEngine:
         return local_to_utc(deadline_local, dest_fac.timezone)
 
 
+def _timing_inputs(data: dict) -> dict:
+    """Subset of the loaded inputs that the timing stage needs (kept small for worker pickling)."""
+    return {
+        key: data[key]
+        for key in ("facilities", "mileage_bands", "timing_params", "arc_cpts", "run_settings")
+    }
+
+
 def calculate_all_path_timings(
         data: dict,
-        od_paths: dict[tuple[str, str], list[PathCandidate]]
+        od_paths: dict[tuple[str, str], list[PathCandidate]],
+        workers: int = 1
 ) -> dict[tuple[str, str], list[PathTimingResult]]:
+    """
+    Calculate timing for every candidate path.
+
+    With workers > 1 the OD pairs are split round-robin across a process pool;
+    each worker builds its own CPT generator and engine from the same inputs.
+    """
+    if workers > 1 and len(od_paths) > 1:
+        od_keys = list(od_paths.keys())
+        chunks = [
+            {key: od_paths[key] for key in od_keys[i::workers]}
+            for i in range(workers)
+        ]
+        inputs = _timing_inputs(data)
+
+        od_timings = {}
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for chunk_timings in pool.map(calculate_all_path_timings, [inputs] * len(chunks), chunks):
+                od_timings.update(chunk_timings)
+
+        logger.info(f"Calculated timings for {sum(len(t) for t in od_timings.values())} paths "
+                    f"using {workers} workers")
+        return od_timings
+
     cpt_generator = CPTGenerator(
         facilities=data["facilities"],
         arc_cpts=data["arc_cpts"]
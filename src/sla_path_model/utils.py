@@ -6,6 +6,8 @@ from typing import Optional
 
 import pandas as pd
 
+from .config import DAYS_OF_WEEK, ALL_DAYS_MASK
+
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
     """Configure and return logger that writes to stdout."""
@@ -70,19 +72,18 @@ def parse_time_value(val) -> Optional[time]:
     raise ValueError(f"Unexpected time value type: {type(val)} = {val}")
 
 
-def parse_days_of_week(val: str) -> list[str]:
-    """Parse days of week from comma-separated string."""
+def parse_days_of_week(val: str) -> int:
+    """Parse days of week from comma-separated string into a bitmask (Mon = bit 0)."""
     if not val or pd.isna(val):
-        return ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
-
-    valid_days = {"Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"}
-    days = [d.strip() for d in str(val).split(",")]
+        return ALL_DAYS_MASK
 
-    for day in days:
-        if day not in valid_days:
-            raise ValueError(f"Invalid day of week: {day}. Must be one of {valid_days}")
+    mask = 0
+    for day in (d.strip() for d in str(val).split(",")):
+        if day not in DAYS_OF_WEEK:
+            raise ValueError(f"Invalid day of week: {day}. Must be one of {set(DAYS_OF_WEEK)}")
+        mask |= 1 << DAYS_OF_WEEK.index(day)
 
-    return days
+    return mask
 
 
 def format_path_nodes(nodes: list[str]) -> str:
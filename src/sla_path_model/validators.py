@@ -2,7 +2,6 @@
 Input validation functions.
 """
 from collections import defaultdict
-from typing import Optional
 
 from .config import (
     Facility, FacilityType, MileageBand, ServiceCommitment, TimingParams,
@@ -1,17 +1,27 @@
 """
-Write model results to Excel output file.
+Write model results to Excel (default) or Parquet output files.
 """
 from pathlib import Path
 
 import pandas as pd
 
+from .config import OUTPUT_FORMATS
 from .utils import setup_logging
 
 logger = setup_logging()
 
+# Rows per Parquet row group; also the unit of conversion when streaming reports
+PARQUET_ROW_GROUP_ROWS = 65536
+
+
+def write_outputs(reports: dict[str, pd.DataFrame], output_path: str, output_format: str = "xlsx") -> None:
+    """Write all reports to an Excel file with multiple sheets, or to Parquet files."""
+    if output_format == "parquet":
+        write_parquet_outputs(reports, output_path)
+        return
+    if output_format != "xlsx":
+        raise ValueError(f"Unknown output format: {output_format}. Must be one of {list(OUTPUT_FORMATS)}")
 
-def write_outputs(reports: dict[str, pd.DataFrame], output_path: str) -> None:
-    """Write all reports to an Excel file with multiple sheets."""
     output_dir = Path(output_path).parent
     output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -35,4 +45,55 @@ def write_outputs(reports: dict[str, pd.DataFrame], output_path: str) -> None:
             if sheet_name not in sheet_order:
                 df.to_excel(writer, sheet_name=sheet_name, index=False)
 
-    logger.info(f"Wrote output to {output_path}")
\ No newline at end of file
+    logger.info(f"Wrote output to {output_path}")
+
+
+def check_parquet_support() -> None:
+    """Raise ImportError early if the optional pyarrow dependency is missing."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            "Parquet output requires pyarrow. Install with: pip install 'sla_path_model[parquet]'"
+        )
+
+
+def write_parquet_outputs(reports: dict[str, pd.DataFrame], output_dir: str) -> None:
+    """
+    Write each report to <output_dir>/<report_name>.parquet (Snappy compressed).
+
+    Columnar output is far smaller and faster to write than xlsx for large
+    path tables. Rows are converted and written one row group at a time
+    (PARQUET_ROW_GROUP_ROWS), so the Arrow copy never holds a whole report.
+    "N/A" cells are written as nulls so diagnostic columns keep their
+    numeric/bool types. Requires the optional pyarrow dependency.
+    """
+    check_parquet_support()
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    for sheet_name, df in reports.items():
+        schema = _parquet_schema(df)
+        with pq.ParquetWriter(output_dir / f"{sheet_name}.parquet", schema, compression="snappy") as writer:
+            for start in range(0, len(df), PARQUET_ROW_GROUP_ROWS):
+                # "N/A" placeholders mix strings into numeric/bool columns; Parquet has real nulls
+                chunk = df.iloc[start:start + PARQUET_ROW_GROUP_ROWS].replace("N/A", None)
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+
+    logger.info(f"Wrote {len(reports)} Parquet reports to {output_dir}")
+
+
+def _parquet_schema(df: pd.DataFrame):
+    """Arrow schema for a report, inferring object column types with "N/A" cells ignored."""
+    import pyarrow as pa
+
+    fields = []
+    for col in df.columns:
+        values = df[col]
+        if values.dtype == object:
+            values = values[values != "N/A"]
+        fields.append(pa.field(str(col), pa.Array.from_pandas(values).type))
+    return pa.schema(fields)